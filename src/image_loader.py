@@ -0,0 +1,90 @@
+import os
+import threading
+from typing import Tuple
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage, QPixmap
+from utils.image_utils import load_scaled_image
+
+
+# Thread pool priorities: loads for a slot waiting to change run ahead of prefetches;
+# loads needed at a known moment soon (the landscape switch after a preview) run in between
+PRIORITY_VISIBLE = 2
+PRIORITY_UPCOMING = 1
+PRIORITY_PREFETCH = 0
+
+
+def default_worker_count() -> int:
+    """Default number of decode threads"""
+    return min(4, os.cpu_count() or 2)
+
+
+class _LoadSignals(QObject):
+    """Signals emitted by load tasks (lives on the GUI thread)"""
+    finished = pyqtSignal(str, tuple, QImage)  # image path, target size, image
+
+
+class ImageLoadTask(QRunnable):
+    """Decode and scale a single image on a worker thread"""
+    def __init__(self, image_path: str, target_size: Tuple[int, int], signals: _LoadSignals,
+                 claim: threading.Lock):
+        super().__init__()
+        self.image_path = image_path
+        self.target_size = target_size
+        self.signals = signals
+        # Shared by every task queued for the same load; only the first to run decodes
+        self.claim = claim
+
+    def run(self):
+        if not self.claim.acquire(blocking=False):
+            return
+        image = load_scaled_image(self.image_path, self.target_size, maintain_aspect=True)
+        if image is None:
+            image = QImage()
+        self.signals.finished.emit(self.image_path, self.target_size, image)
+
+
+class ImageLoader(QObject):
+    """Loads images on a thread pool and delivers them as QPixmaps on the GUI thread"""
+
+    loaded = pyqtSignal(str, tuple, QPixmap)  # image path, target size, pixmap (null on failure)
+
+    def __init__(self, num_workers: int = 0, parent=None):
+        super().__init__(parent)
+        # Own pool, so decodes neither compete with nor are capped by other users
+        # of the global pool. Created before the signals object so that, as a
+        # child, it is destroyed (waiting for running tasks) first
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(num_workers or default_worker_count())
+        self._signals = _LoadSignals(self)
+        # Queued back to this thread, where QPixmap may be created
+        self._signals.finished.connect(self._on_task_finished)
+        self._queued = {}  # (image path, target size) -> (claim, priority) of loads not yet delivered
+
+    def load(self, image_path: str, target_size: Tuple[int, int], priority: int = PRIORITY_VISIBLE):
+        """Start loading an image scaled to fit target_size, unless the same load is already queued"""
+        key = (image_path, tuple(target_size))
+        queued = self._queued.get(key)
+        if queued is not None:
+            claim, queued_priority = queued
+            if priority <= queued_priority:
+                return
+            # Re-queue at the higher priority. The pool can't reorder a queued task,
+            # and tryTake would need the runnables kept alive by hand, so a second
+            # task shares the claim: whichever runs first decodes, the other returns
+        else:
+            claim = threading.Lock()
+        self._queued[key] = (claim, priority)
+        self.pool.start(ImageLoadTask(key[0], key[1], self._signals, claim), priority)
+
+    def shutdown(self):
+        """Drop queued loads and wait for running ones to finish"""
+        self.pool.clear()
+        self.pool.waitForDone()
+        self._queued.clear()
+
+    @pyqtSlot(str, tuple, QImage)
+    def _on_task_finished(self, image_path: str, target_size: tuple, image: QImage):
+        """Convert the decoded image to a pixmap on the GUI thread"""
+        self._queued.pop((image_path, target_size), None)
+        pixmap = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+        self.loaded.emit(image_path, target_size, pixmap)
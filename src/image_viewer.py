@@ -1,21 +1,28 @@
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QVBoxLayout, QSizePolicy, QFrame, QGraphicsOpacityEffect, QGraphicsBlurEffect, QStackedLayout
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal, pyqtSlot, QSize, QPropertyAnimation, QSequentialAnimationGroup, QParallelAnimationGroup
-from PyQt6.QtGui import QPixmap, QPalette, QColor, QTransform, QPainter, QFont, QPen, QBrush, QImage
+from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QLabel, QVBoxLayout, QSizePolicy, QFrame,
+                             QGraphicsBlurEffect, QStackedLayout, QStyle, QStyleOption)
+from PyQt6.QtCore import QTimer, QElapsedTimer, QEvent, Qt, pyqtSignal, pyqtSlot, pyqtProperty, QSize, QPoint, QPointF, QPropertyAnimation, QAbstractAnimation, QSequentialAnimationGroup
+from PyQt6.QtGui import QPixmap, QPixmapCache, QPalette, QColor, QTransform, QPainter, QFont, QPen, QBrush, QImage
 from typing import List, Optional, Tuple
 from enum import Enum
-from collections import deque
+from collections import deque, Counter
 import sys
 import random
-import time
 import os
 from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 sys.path.append('..')
 from utils.image_utils import (get_image_files, get_image_files_from_dirs, 
-                              load_and_scale_image, get_random_images, 
-                              calculate_image_dimensions)
+                              get_random_images, 
+                              calculate_image_dimensions, close_to_size)
+from utils.blur_utils import gaussian_pyramid_blur
+from utils.orientation_cache import (file_signature, load_orientation_cache,
+                                     lookup_orientation, prune_orientation_cache,
+                                     save_orientation_cache)
+from src.image_loader import (ImageLoader, default_worker_count, PRIORITY_VISIBLE, PRIORITY_UPCOMING,
+                              PRIORITY_PREFETCH)
 from src.translations import tr
-from src.logger import debug, info, warning, error
+from src.logger import debug, info, warning, error, is_debug_enabled
 
 
 class DisplayMode(Enum):
@@ -29,6 +36,76 @@ class LayoutMode(Enum):
     LANDSCAPE = "landscape"  # Single horizontal row
 
 
+# Window / letterbox background and the alpha of the dark overlay on blurred backgrounds
+_BG_COLOR = QColor(10, 10, 10)
+_BLUR_OVERLAY_ALPHA = 120
+
+# Budget of Qt's shared pixmap cache, which holds the scaled slot/landscape images (KB)
+_PIXMAP_CACHE_KB = 256 * 1024
+
+
+# Image path -> mtime, captured when the library is scanned so building cache
+# keys never stats files on the GUI thread
+_file_mtimes: dict = {}
+
+
+def _pixmap_cache_key(image_path: str, target_size: Tuple[int, int]) -> Optional[str]:
+    """QPixmapCache key for an image scaled to target_size; the mtime makes files edited between runs miss"""
+    mtime = _file_mtimes.get(image_path)
+    if mtime is None:
+        # Not part of the scanned library: stat once and remember it
+        try:
+            mtime = os.path.getmtime(image_path)
+        except OSError:
+            return None
+        _file_mtimes[image_path] = mtime
+    return f"{image_path}|{mtime}|{target_size[0]}x{target_size[1]}"
+
+
+def _probe_orientation(image_path: str) -> Tuple[str, bool, Optional[Exception]]:
+    """Read an image header: (path, is landscape, error if the file couldn't be read)"""
+    try:
+        # Use PIL to get image dimensions without loading full image
+        with Image.open(image_path) as img:
+            width, height = img.size
+            return image_path, width > height, None
+    except Exception as e:
+        # Assume portrait if can't determine
+        return image_path, False, e
+
+
+def _probe_orientation_cached(cache: dict, image_path: str
+                              ) -> Tuple[str, bool, Optional[Exception], Optional[list], Optional[Tuple[float, int]]]:
+    """_probe_orientation that first consults the on-disk cache; also returns the entry to store and the file signature"""
+    signature = file_signature(image_path)
+    is_landscape = lookup_orientation(cache, image_path, signature)
+    if is_landscape is not None:
+        return image_path, is_landscape, None, None, signature
+    image_path, is_landscape, exc = _probe_orientation(image_path)
+    # Unreadable files are retried next start rather than remembered as portrait
+    entry = [signature[0], signature[1], is_landscape] if exc is None and signature else None
+    return image_path, is_landscape, exc, entry, signature
+
+
+# Share of the pixmap cache the startup landscape warm-up may fill (KB)
+_LANDSCAPE_WARM_KB = _PIXMAP_CACHE_KB // 2
+
+# Offset between slot timer restarts on resume (ms)
+_RESUME_STAGGER_MS = 150
+
+# Upcoming images per slot picked and decoded ahead of its timer
+_PREFETCH_DEPTH = 2
+
+# Timing option label -> (min, max) interval in milliseconds
+_TIMING_MAP = {
+    "2-4 seconds": (2000, 4000),
+    "3-5 seconds": (3000, 5000),
+    "4-6 seconds": (4000, 6000),
+    "5-7 seconds": (5000, 7000),
+    "6-8 seconds": (6000, 8000)
+}
+
+
 class ImageLabel(QLabel):
     """Custom QLabel for displaying images with different display modes"""
     def __init__(self, parent=None):
@@ -43,118 +120,240 @@ class ImageLabel(QLabel):
         """)
         self.setScaledContents(False)
         self._original_pixmap: Optional[QPixmap] = None
-        self._background_pixmap: Optional[QPixmap] = None
+        self._image_path: Optional[str] = None  # source file of the shown image, keys the shared blur cache
+        self._scaled_cache: dict = {}  # (cacheKey, device width, device height, aspect mode) -> QPixmap
+        self._last_render_key: Optional[tuple] = None  # (cacheKey, width, height, DPR, mode) of the shown frame
         self._display_mode = DisplayMode.BLUR_FILL  # Default to blur fill
+        # Cross-fade state: the frame being faded out and how far the new one has faded in
+        self._fade_from: Optional[QPixmap] = None
+        self._fade_progress = 1.0
         self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
         
-    def set_image(self, pixmap: QPixmap):
+        # Coalesce bursts of resize events into a single rebuild
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(30)
+        self._resize_timer.timeout.connect(self.update_display)
+        
+    def set_image(self, pixmap: QPixmap, image_path: Optional[str] = None):
         """Set image while maintaining aspect ratio"""
         if pixmap and not pixmap.isNull():
             self._original_pixmap = pixmap
+            self._image_path = image_path
+            self._scaled_cache.clear()
+            self._last_render_key = None
             self.update_display()
             
+    def fade_to_image(self, pixmap: QPixmap, image_path: Optional[str] = None):
+        """Show a new image, keeping the current frame to cross-fade from"""
+        if not pixmap or pixmap.isNull():
+            return
+        current = self.pixmap()
+        self._fade_from = current if current and not current.isNull() else None
+        self._fade_progress = 0.0
+        self.set_image(pixmap, image_path)
+        
+    def get_fade_progress(self) -> float:
+        return self._fade_progress
+        
+    def set_fade_progress(self, value: float):
+        self._fade_progress = value
+        if value >= 1.0:
+            # Fade finished - drop the old frame and paint normally again
+            self._fade_from = None
+        self.update()
+        
+    # Animated by ImageSlot: 0.0 shows the old frame, 1.0 only the new one
+    fade_progress = pyqtProperty(float, fget=get_fade_progress, fset=set_fade_progress)
+    
+    def paintEvent(self, event):
+        """Blend the old and new frames while a cross-fade is running"""
+        current = self.pixmap()
+        if self._fade_from is None or not current or current.isNull():
+            super().paintEvent(event)
+            return
+        
+        painter = QPainter(self)
+        # Stylesheet background and border, as QLabel would draw them
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, option, painter, self)
+        
+        # Both frames are centered in the contents rect, like QLabel's AlignCenter
+        rect = self.contentsRect()
+        for frame, opacity in ((self._fade_from, 1.0 - self._fade_progress),
+                               (current, self._fade_progress)):
+            painter.setOpacity(opacity)
+            size = frame.deviceIndependentSize()
+            painter.drawPixmap(QPointF(rect.x() + int((rect.width() - size.width()) / 2),
+                                       rect.y() + int((rect.height() - size.height()) / 2)), frame)
+        painter.end()
+            
     def set_display_mode(self, mode: DisplayMode):
         """Set the display mode and update the display"""
         if self._display_mode != mode:
             self._display_mode = mode
             self.update_display()
             
+    def _device_size(self) -> QSize:
+        """Label size in device pixels, so HiDPI screens paint pixmaps 1:1"""
+        return self.size() * self.devicePixelRatioF()
+        
+    def _get_scaled(self, pixmap: QPixmap, size: QSize, aspect_mode: Qt.AspectRatioMode) -> QPixmap:
+        """Smooth-scale a pixmap to a device-pixel size, reusing the result while the inputs are unchanged"""
+        key = (pixmap.cacheKey(), size.width(), size.height(), aspect_mode)
+        scaled = self._scaled_cache.get(key)
+        if scaled is None:
+            fitted = pixmap.size().scaled(size, aspect_mode)
+            # Decodes already arrive at (about) the slot size; reuse them as they are.
+            # Fill modes crop to the exact size, so they need at least the full size
+            if (fitted == pixmap.size()
+                    or (aspect_mode == Qt.AspectRatioMode.KeepAspectRatio
+                        and close_to_size(pixmap.width(), pixmap.height(), fitted.width(), fitted.height()))):
+                scaled = QPixmap(pixmap)
+            else:
+                scaled = pixmap.scaled(size, aspect_mode, Qt.TransformationMode.SmoothTransformation)
+            scaled.setDevicePixelRatio(self.devicePixelRatioF())
+            # Only the current fit and fill variants are worth keeping
+            if len(self._scaled_cache) >= 2:
+                self._scaled_cache.clear()
+            self._scaled_cache[key] = scaled
+        return scaled
+        
     def create_blurred_background(self, pixmap: QPixmap) -> QPixmap:
         """Create a blurred version of the image for background"""
-        # Scale image to fill the entire label (may crop)
+        # Stretch image to fill the entire label. This copy is only fed into
+        # the blur, so neither the aspect ratio nor a smooth resample matters
+        size = self._device_size()
+        if size.isEmpty() or pixmap.isNull():
+            return QPixmap()  # Nothing to blur (collapsed label); the backdrop stays plain
         scaled_fill = pixmap.scaled(
-            self.size(),
-            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation
+            size,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.FastTransformation
         )
+
+        # Blur via a Gaussian pyramid, darkening the small buffer with the
+        # overlay for better contrast, then scale back up. The depth follows
+        # the label width (1/4 to 1/16) so the blur radius looks the same
+        # relative to the slot, and small slots don't turn blocky
+        scale = max(4, min(16, size.width() // 200))
+        small = gaussian_pyramid_blur(scaled_fill.toImage(), levels=scale.bit_length() - 1,
+                                      darken=_BLUR_OVERLAY_ALPHA)
+        # Keep the bilinear upscale: a nearest-neighbour one shows the small buffer's pixels
+        blurred = small.scaled(size, Qt.AspectRatioMode.IgnoreAspectRatio,
+                               Qt.TransformationMode.SmoothTransformation)
+        
+        background = QPixmap.fromImage(blurred)
+        background.setDevicePixelRatio(self.devicePixelRatioF())
+        return background
+            
+    def _get_blurred_background(self) -> QPixmap:
+        """Blurred background for the current image and size, shared through QPixmapCache"""
+        device_size = self._device_size()
+        size = (device_size.width(), device_size.height())
+        # Keyed by file so every label showing the image at this size shares one blur;
+        # images without a (readable) file fall back to the pixmap identity
+        key = _pixmap_cache_key(self._image_path, size) if self._image_path else None
+        if key is None:
+            key = f"#{self._original_pixmap.cacheKey()}|{size[0]}x{size[1]}"
+        key = "blur|" + key
+        background = QPixmapCache.find(key)
+        if background is None:
+            background = self.create_blurred_background(self._original_pixmap)
+            if not background.isNull():
+                QPixmapCache.insert(key, background)
+        return background
         
-        # Crop to exact size if needed
-        if scaled_fill.size() != self.size():
-            x = (scaled_fill.width() - self.width()) // 2
-            y = (scaled_fill.height() - self.height()) // 2
-            scaled_fill = scaled_fill.copy(x, y, self.width(), self.height())
-        
-        # Simple blur: scale down then up
-        small_size = QSize(max(1, self.width() // 8), max(1, self.height() // 8))
-        blurred = scaled_fill.scaled(small_size, Qt.AspectRatioMode.IgnoreAspectRatio, 
-                                    Qt.TransformationMode.SmoothTransformation)
-        blurred = blurred.scaled(self.size(), Qt.AspectRatioMode.IgnoreAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation)
-        
-        # Add a dark overlay for better contrast
-        painter = QPainter(blurred)
-        painter.fillRect(blurred.rect(), QColor(0, 0, 0, 120))
-        painter.end()
-        
-        return blurred
-            
     def update_display(self):
         """Update the displayed image based on current display mode"""
         if self._original_pixmap and not self._original_pixmap.isNull():
-            if self._display_mode == DisplayMode.FIT:
+            # Same image, size and mode as the frame already shown: nothing to redo
+            render_key = (self._original_pixmap.cacheKey(), self.width(), self.height(),
+                          self.devicePixelRatioF(), self._display_mode)
+            # Scaled at device pixels and tagged with the ratio, so painting is a 1:1 copy
+            device_size = self._device_size()
+            if render_key == self._last_render_key:
+                return
+            self._last_render_key = render_key
+            
+            mode = self._display_mode
+            if mode == DisplayMode.BLUR_FILL:
+                # Aspect ratios within 2%: the fitted image covers all but a sliver,
+                # so the blurred background would never be seen - render as FIT
+                image_ratio = self._original_pixmap.width() / self._original_pixmap.height()
+                label_ratio = self.width() / max(1, self.height())
+                # A collapsed (zero-sized) label has no background to blur either
+                if abs(image_ratio - label_ratio) < 0.02 * label_ratio or device_size.isEmpty():
+                    mode = DisplayMode.FIT
+            
+            if mode == DisplayMode.FIT:
                 # Original fit mode - just scale and center with black bars
-                scaled = self._original_pixmap.scaled(
-                    self.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
+                scaled = self._get_scaled(self._original_pixmap, device_size,
+                                          Qt.AspectRatioMode.KeepAspectRatio)
                 super().setPixmap(scaled)
                 
-            elif self._display_mode == DisplayMode.BLUR_FILL:
+            elif mode == DisplayMode.BLUR_FILL:
                 # Blur fill mode - blurred background with centered image
-                display_pixmap = QPixmap(self.size())
-                display_pixmap.fill(QColor(10, 10, 10))
+                background = self._get_blurred_background()
                 
-                painter = QPainter(display_pixmap)
-                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                # The background is opaque and label-sized, so start from a copy of
+                # it rather than allocating, filling and drawing onto a new pixmap.
+                # (A reused back buffer would still be detached here: the label and
+                # the cross-fade keep references to the previous frame)
+                display_pixmap = background.copy()
                 
-                # Draw blurred background
-                blurred_bg = self.create_blurred_background(self._original_pixmap)
-                painter.drawPixmap(0, 0, blurred_bg)
+                # Only integer-aligned pixmaps are drawn, so no render hints are needed
+                painter = QPainter(display_pixmap)
                 
                 # Draw the main image on top
-                scaled = self._original_pixmap.scaled(
-                    self.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
+                scaled = self._get_scaled(self._original_pixmap, device_size,
+                                          Qt.AspectRatioMode.KeepAspectRatio)
                 
-                # Center the image
-                x = (self.width() - scaled.width()) // 2
-                y = (self.height() - scaled.height()) // 2
-                painter.drawPixmap(x, y, scaled)
+                # Center the image on a whole device pixel; the painter works in
+                # logical coordinates, hence the division by the ratio
+                dpr = display_pixmap.devicePixelRatio()
+                x = (display_pixmap.width() - scaled.width()) // 2
+                y = (display_pixmap.height() - scaled.height()) // 2
+                painter.drawPixmap(QPointF(x / dpr, y / dpr), scaled)
                 
                 painter.end()
                 
                 super().setPixmap(display_pixmap)
                 
-            elif self._display_mode == DisplayMode.ZOOM_FILL:
+            elif mode == DisplayMode.ZOOM_FILL:
                 # Zoom fill mode - scale to fill and crop
-                scaled = self._original_pixmap.scaled(
-                    self.size(),
-                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                    Qt.TransformationMode.SmoothTransformation
-                )
+                scaled = self._get_scaled(self._original_pixmap, device_size,
+                                          Qt.AspectRatioMode.KeepAspectRatioByExpanding)
                 
-                # Crop to exact size if needed
-                if scaled.size() != self.size():
-                    x = (scaled.width() - self.width()) // 2
-                    y = (scaled.height() - self.height()) // 2
-                    scaled = scaled.copy(x, y, self.width(), self.height())
+                # Crop to exact size if needed, keeping the crop in the cache in
+                # place of the oversized scale so mode toggles reuse it directly
+                if scaled.size() != device_size:
+                    x = (scaled.width() - device_size.width()) // 2
+                    y = (scaled.height() - device_size.height()) // 2
+                    scaled = scaled.copy(x, y, device_size.width(), device_size.height())
+                    key = (self._original_pixmap.cacheKey(), device_size.width(), device_size.height(),
+                           Qt.AspectRatioMode.KeepAspectRatioByExpanding)
+                    self._scaled_cache[key] = scaled
                 
                 super().setPixmap(scaled)
             
     def resizeEvent(self, event):
         """Rescale image when label is resized"""
         super().resizeEvent(event)
+        self._scaled_cache.clear()
         if self._original_pixmap and not self._original_pixmap.isNull():
-            self.update_display()
+            self._resize_timer.start()
             
     def clear(self):
         """Clear the label"""
         super().clear()
         self._original_pixmap = None
-        self._background_pixmap = None
+        self._last_render_key = None
+        self._fade_from = None
+        self._fade_progress = 1.0
+        self._image_path = None
+        self._scaled_cache.clear()
 
 
 class ImageSlot(QFrame):
@@ -162,18 +361,54 @@ class ImageSlot(QFrame):
     
     clicked = pyqtSignal(int)  # Signal when clicked, sends slot index
     favorite_toggled = pyqtSignal(int, str, bool)  # slot index, image path, is_favorited
+
+    # Favorite icon styles, selected through the "favorited" dynamic property
+    _FAVORITE_QSS = """
+        QLabel {
+            background-color: rgba(0, 0, 0, 150);
+            color: white;
+            border-radius: 20px;
+            padding: 8px;
+            font-size: 20px;
+        }
+        QLabel:hover {
+            background-color: rgba(255, 0, 0, 100);
+        }
+        QLabel[favorited="true"] {
+            background-color: rgba(255, 0, 0, 150);
+        }
+        QLabel[favorited="true"]:hover {
+            background-color: rgba(255, 0, 0, 200);
+        }
+    """
     
-    def __init__(self, slot_index: int, parent=None):
+    # Gold frame of the dedicated favorites slot, selected through the "dedicated" dynamic property
+    _DEDICATED_QSS = """
+        ImageSlot[dedicated="true"] {
+            border: 3px solid #ffd700;
+            border-radius: 12px;
+            background-color: rgba(255, 215, 0, 10);
+        }
+    """
+
+    def __init__(self, slot_index: int, parent=None, rng: Optional[random.Random] = None):
         super().__init__(parent)
         self.slot_index = slot_index
+        self._rng = rng or random.Random()  # Shared with the viewer (one RNG for all picks)
         self.current_image_path = ""
         self.is_transitioning = False
         self.is_pinned = False
         self.is_favorited = False
+        self._last_size = QSize()
+        self._dedicated_size: Optional[QSize] = None
+        self._hovered = False
         self.setFrameStyle(QFrame.Shape.NoFrame)
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setMouseTracking(True)  # Enable mouse tracking for hover
+        # Parsed once; set_dedicated only flips the property
+        self.setStyleSheet(self._DEDICATED_QSS)
+        self.setProperty("dedicated", False)
         self.init_ui()
         
     def init_ui(self):
@@ -181,22 +416,15 @@ class ImageSlot(QFrame):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
-        # Create two labels for smooth transitions
-        self.current_label = ImageLabel()
-        self.next_label = ImageLabel()
-        self.next_label.hide()
-        
-        # Stack them on top of each other
-        self.current_label.setParent(self)
-        self.next_label.setParent(self)
-        
-        
-        # Set up opacity effects
-        self.current_opacity = QGraphicsOpacityEffect()
-        self.next_opacity = QGraphicsOpacityEffect()
-        self.current_label.setGraphicsEffect(self.current_opacity)
-        self.next_label.setGraphicsEffect(self.next_opacity)
+        # Single label; transitions cross-fade inside it (no QGraphicsOpacityEffect
+        # off-screen renders during the fade)
+        self.current_label = ImageLabel(self)
+        self.fade_animation = QPropertyAnimation(self.current_label, b"fade_progress", self)
+        self.fade_animation.setStartValue(0.0)
+        self.fade_animation.setEndValue(1.0)
+        self.fade_animation.finished.connect(self.on_transition_complete)
         
+        # Layout-managed, zero margins: the label always fills the slot
         layout.addWidget(self.current_label)
         
         # Create pin icon label (overlay)
@@ -220,8 +448,14 @@ class ImageSlot(QFrame):
         self.pin_label.setCursor(Qt.CursorShape.PointingHandCursor)
         self.pin_label.setToolTip(tr('hint_click_to_unpin'))
         
-        # Create custom tooltip widget
-        self.tooltip_widget = QLabel(self)
+        # Create custom tooltip widget. A frameless tooltip window owned by the slot, so
+        # its fade is done by the compositor via windowOpacity instead of an
+        # off-screen QGraphicsOpacityEffect pass
+        # (input-transparent, so appearing under the cursor doesn't trigger a leave)
+        self.tooltip_widget = QLabel(self, Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint
+                                     | Qt.WindowType.WindowTransparentForInput)
+        self.tooltip_widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.tooltip_widget.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
         self.tooltip_widget.setStyleSheet("""
             QLabel {
                 background-color: rgba(60, 60, 60, 80);
@@ -233,17 +467,12 @@ class ImageSlot(QFrame):
         """)
         self.tooltip_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.tooltip_widget.hide()
-        self.tooltip_widget.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         
         # Create tooltip timer
         self.tooltip_timer = QTimer()
         self.tooltip_timer.setSingleShot(True)
         self.tooltip_timer.timeout.connect(self.hide_tooltip)
         
-        # Create tooltip opacity effect
-        self.tooltip_opacity = QGraphicsOpacityEffect()
-        self.tooltip_widget.setGraphicsEffect(self.tooltip_opacity)
-        
         # Create favorite icon label (overlay)
         self.favorite_label = QLabel(self)
         
@@ -263,18 +492,9 @@ class ImageSlot(QFrame):
         self.dedicated_label.setText(tr('favorites_slot'))
         self.dedicated_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.dedicated_label.hide()
-        self.favorite_label.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 150);
-                color: white;
-                border-radius: 20px;
-                padding: 8px;
-                font-size: 20px;
-            }
-            QLabel:hover {
-                background-color: rgba(255, 0, 0, 100);
-            }
-        """)
+        # One stylesheet for both states; toggling only flips the "favorited" property
+        self.favorite_label.setStyleSheet(self._FAVORITE_QSS)
+        self.favorite_label.setProperty("favorited", False)
         self.favorite_label.setText("♡")  # Empty heart
         self.favorite_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.favorite_label.setFixedSize(40, 40)
@@ -289,54 +509,33 @@ class ImageSlot(QFrame):
             return
             
         if self.is_transitioning:
-            debug(f"Image dropped during transition: {os.path.basename(image_path)}")
+            debug("Image dropped during transition: %s", os.path.basename(image_path))
             return
             
         self.current_image_path = image_path
         
-        if initial:
-            # Initial load - no animation
-            self.current_label.set_image(pixmap)
-            self.current_opacity.setOpacity(1.0)
+        # Initial load, or nobody would see the fade (hidden or minimized) - no animation
+        if (initial or not self.isVisible()
+                or self.window().windowState() & Qt.WindowState.WindowMinimized):
+            self.current_label.set_image(pixmap, image_path)
         else:
             # Animate transition with random effect
             self.is_transitioning = True
             self.fast_transition = fast_transition
-            effect_type = random.choice(['fade', 'fade_rotate'])
-            
-            if effect_type == 'fade':
+            if self._rng.random() < 0.5:
                 self.simple_fade_transition(pixmap)
             else:
                 self.fade_rotate_transition(pixmap)
                 
     def simple_fade_transition(self, pixmap: QPixmap):
         """Simple fade transition"""
-        # Set new image on next label
-        self.next_label.set_image(pixmap)
-        self.next_label.move(self.current_label.pos())
-        self.next_label.resize(self.current_label.size())
-        self.next_label.show()
-        
         # Use faster animation for landscape mode
         duration = 400 if hasattr(self, 'fast_transition') and self.fast_transition else 800
         
-        # Create fade animations
-        fade_out = QPropertyAnimation(self.current_opacity, b"opacity")
-        fade_out.setDuration(duration)
-        fade_out.setStartValue(1.0)
-        fade_out.setEndValue(0.0)
-        
-        fade_in = QPropertyAnimation(self.next_opacity, b"opacity")
-        fade_in.setDuration(duration)
-        fade_in.setStartValue(0.0)
-        fade_in.setEndValue(1.0)
-        
-        # Parallel animation
-        self.anim_group = QParallelAnimationGroup()
-        self.anim_group.addAnimation(fade_out)
-        self.anim_group.addAnimation(fade_in)
-        self.anim_group.finished.connect(self.on_transition_complete)
-        self.anim_group.start()
+        # Cross-fade from the frame currently shown to the new image
+        self.current_label.fade_to_image(pixmap, self.current_image_path)
+        self.fade_animation.setDuration(duration)
+        self.fade_animation.start()
         
     def fade_rotate_transition(self, pixmap: QPixmap):
         """Fade with slight rotation effect"""
@@ -345,34 +544,38 @@ class ImageSlot(QFrame):
         
     def on_transition_complete(self):
         """Handle transition completion"""
-        # Swap labels
-        self.current_label, self.next_label = self.next_label, self.current_label
-        self.current_opacity, self.next_opacity = self.next_opacity, self.current_opacity
-        
-        # Hide the old label
-        self.next_label.hide()
-        self.next_opacity.setOpacity(0.0)
-        
         self.is_transitioning = False
         
     def resizeEvent(self, event):
         """Handle resize to keep labels aligned"""
         super().resizeEvent(event)
-        # Make sure both labels fill the slot
-        rect = self.rect()
-        self.current_label.setGeometry(rect)
-        self.next_label.setGeometry(rect)
-        # Position pin label in top-right corner
-        self.pin_label.move(rect.width() - 50, 10)
-        # Position favorite label below pin label
-        self.favorite_label.move(rect.width() - 50, 60)
-        # Position dedicated label at bottom left
-        self.dedicated_label.adjustSize()
-        self.dedicated_label.move(10, rect.height() - self.dedicated_label.height() - 10)
+        # Layout invalidation can re-send the same size; nothing to reposition then
+        new_size = event.size()
+        if new_size == self._last_size:
+            return
+        self._last_size = QSize(new_size)
+        self._layout_overlays(new_size.width(), new_size.height())
+        
+    def _layout_overlays(self, w: int, h: int):
+        """Place the overlay labels for a slot of size w x h"""
+        # The image label is sized by the layout; only the overlays are placed by hand
+        # Pin label in top-right corner, favorite label below it
+        self.pin_label.move(w - 50, 10)
+        self.favorite_label.move(w - 50, 60)
+        # Dedicated label at bottom left; its text is fixed, so size it only once
+        if self._dedicated_size is None:
+            self.dedicated_label.adjustSize()
+            self._dedicated_size = self.dedicated_label.size()
+        self.dedicated_label.move(10, h - self._dedicated_size.height() - 10)
         # Reposition tooltip if visible
         if self.tooltip_widget.isVisible():
-            x = (rect.width() - self.tooltip_widget.width()) // 2
-            self.tooltip_widget.move(x, 20)
+            self.position_tooltip(w)
+        
+    def position_tooltip(self, w: int):
+        """Center the tooltip window near the top of the slot"""
+        x = (w - self.tooltip_widget.width()) // 2
+        y = 20  # Position near top
+        self.tooltip_widget.move(self.mapToGlobal(QPoint(x, y)))
         
     def sizeHint(self):
         """Provide size hint to maintain equal sizes"""
@@ -380,6 +583,13 @@ class ImageSlot(QFrame):
         
     def enterEvent(self, event):
         """Show tooltip on mouse enter"""
+        # Showing or hiding the tooltip window can re-deliver an enter while the
+        # cursor never left; only the first one of a hover shows the tooltip
+        if self._hovered:
+            super().enterEvent(event)
+            return
+        self._hovered = True
+        
         # Set text based on pin state
         if self.is_pinned:
             self.tooltip_widget.setText(tr('hint_click_to_unpin'))
@@ -388,13 +598,12 @@ class ImageSlot(QFrame):
         
         # Adjust size and position
         self.tooltip_widget.adjustSize()
-        x = (self.width() - self.tooltip_widget.width()) // 2
-        y = 20  # Position near top
-        self.tooltip_widget.move(x, y)
+        self.position_tooltip(self.width())
         
         # Show with fade in
+        self.tooltip_widget.setWindowOpacity(0)
         self.tooltip_widget.show()
-        self.tooltip_fade_in = QPropertyAnimation(self.tooltip_opacity, b"opacity")
+        self.tooltip_fade_in = QPropertyAnimation(self.tooltip_widget, b"windowOpacity")
         self.tooltip_fade_in.setDuration(150)
         self.tooltip_fade_in.setStartValue(0)
         self.tooltip_fade_in.setEndValue(1)
@@ -407,6 +616,7 @@ class ImageSlot(QFrame):
         
     def leaveEvent(self, event):
         """Hide tooltip on mouse leave"""
+        self._hovered = False
         self.tooltip_timer.stop()
         self.hide_tooltip()
         super().leaveEvent(event)
@@ -415,13 +625,31 @@ class ImageSlot(QFrame):
         """Hide tooltip with fade out"""
         if not self.tooltip_widget.isVisible():
             return
-        self.tooltip_fade_out = QPropertyAnimation(self.tooltip_opacity, b"opacity")
+        self.tooltip_fade_out = QPropertyAnimation(self.tooltip_widget, b"windowOpacity")
         self.tooltip_fade_out.setDuration(150)
         self.tooltip_fade_out.setStartValue(1)
         self.tooltip_fade_out.setEndValue(0)
         self.tooltip_fade_out.finished.connect(self.tooltip_widget.hide)
         self.tooltip_fade_out.start()
         
+    def showEvent(self, event):
+        """Follow moves of the main window, which the tooltip window doesn't track by itself"""
+        self.window().installEventFilter(self)
+        super().showEvent(event)
+        
+    def eventFilter(self, obj, event):
+        """Keep a visible tooltip attached to the slot when the main window moves"""
+        if event.type() == QEvent.Type.Move and self.tooltip_widget.isVisible():
+            self.position_tooltip(self.width())
+        return super().eventFilter(obj, event)
+        
+    def hideEvent(self, event):
+        """Hide the tooltip window along with the slot"""
+        self._hovered = False
+        self.tooltip_timer.stop()
+        self.tooltip_widget.hide()
+        super().hideEvent(event)
+        
     def mousePressEvent(self, event):
         """Handle mouse clicks to toggle pin state or favorite"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -452,14 +680,21 @@ class ImageSlot(QFrame):
     def set_display_mode(self, mode: DisplayMode):
         """Set display mode for both labels"""
         self.current_label.set_display_mode(mode)
-        self.next_label.set_display_mode(mode)
         
     def toggle_favorite(self):
         """Toggle the favorite state"""
+        if not self.current_image_path:
+            return  # Nothing shown yet
         self.is_favorited = not self.is_favorited
         self.update_favorite_icon()
         self.favorite_toggled.emit(self.slot_index, self.current_image_path, self.is_favorited)
         
+    def clear_image(self):
+        """Show nothing until the next image arrives"""
+        self.current_image_path = ""
+        self.current_label.clear()
+        self.set_favorited(False)
+        
     def set_favorited(self, favorited: bool):
         """Set the favorite state"""
         self.is_favorited = favorited
@@ -467,34 +702,13 @@ class ImageSlot(QFrame):
         
     def update_favorite_icon(self):
         """Update the favorite icon based on state"""
-        if self.is_favorited:
-            self.favorite_label.setText("♥")  # Filled heart
-            self.favorite_label.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(255, 0, 0, 150);
-                    color: white;
-                    border-radius: 20px;
-                    padding: 8px;
-                    font-size: 20px;
-                    }
-                QLabel:hover {
-                    background-color: rgba(255, 0, 0, 200);
-                }
-            """)
-        else:
-            self.favorite_label.setText("♡")  # Empty heart
-            self.favorite_label.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(0, 0, 0, 150);
-                    color: white;
-                    border-radius: 20px;
-                    padding: 8px;
-                    font-size: 20px;
-                    }
-                QLabel:hover {
-                    background-color: rgba(255, 0, 0, 100);
-                }
-            """)
+        self.favorite_label.setText("♥" if self.is_favorited else "♡")  # Filled / empty heart
+        if self.favorite_label.property("favorited") != self.is_favorited:
+            self.favorite_label.setProperty("favorited", self.is_favorited)
+            # Re-evaluate the property selectors without re-parsing the stylesheet
+            style = self.favorite_label.style()
+            style.unpolish(self.favorite_label)
+            style.polish(self.favorite_label)
             
     def set_dedicated(self, dedicated: bool):
         """Set whether this slot is a dedicated favorites slot"""
@@ -502,11 +716,65 @@ class ImageSlot(QFrame):
             self.dedicated_label.show()
         else:
             self.dedicated_label.hide()
+        if self.property("dedicated") != dedicated:
+            self.setProperty("dedicated", dedicated)
+            self.style().unpolish(self)
+            self.style().polish(self)
+            # Re-applying the frame style makes QFrame pick up the new border width
+            self.setFrameStyle(self.frameStyle())
+
+
+class FadeOverlay(QWidget):
+    """Snapshot of a widget (or a plain background curtain) painted on top of it with animated opacity"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._frame = None
+        self._opacity = 1.0
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.hide()
+        
+    def cover(self, widget: QWidget, snapshot: bool = True):
+        """Freeze the current look of widget and show it in its place (a blank curtain without snapshot)"""
+        self._frame = widget.grab() if snapshot else None
+        self._opacity = 1.0
+        self.setGeometry(widget.geometry())
+        self.raise_()
+        self.show()
+        
+    def release(self):
+        """Hide the overlay and drop the snapshot"""
+        self.hide()
+        self._frame = None
+        
+    def get_opacity(self) -> float:
+        return self._opacity
+        
+    def set_opacity(self, value: float):
+        self._opacity = value
+        self.update()
+        
+    # One pixmap blit per animation frame instead of a QGraphicsOpacityEffect pass
+    opacity = pyqtProperty(float, fget=get_opacity, fset=set_opacity)
+    
+    def paintEvent(self, event):
+        """Draw the snapshot at the current opacity"""
+        painter = QPainter(self)
+        if self._frame is None:
+            # Curtain: the background color over the live widget, so fading it out
+            # looks like fading the widget in
+            painter.setOpacity(self._opacity)
+            painter.fillRect(self.rect(), _BG_COLOR)
+        else:
+            # Opaque background hides the live widget underneath
+            painter.fillRect(self.rect(), _BG_COLOR)
+            painter.setOpacity(self._opacity)
+            painter.drawPixmap(0, 0, self._frame)
+        painter.end()
 
 
 class ImageViewer(QWidget):
     images_changed = pyqtSignal()
-    favorites_changed = pyqtSignal(list)  # Emits list of favorite image paths
+    favorites_changed = pyqtSignal(tuple)  # Emits the favorite image paths (read-only snapshot)
     
     def __init__(self, config: dict, parent=None):
         super().__init__(parent)
@@ -518,10 +786,15 @@ class ImageViewer(QWidget):
             # Fallback for old config format
             self.image_files = get_image_files(config.get('images_dir', ''))
         self.image_count = config['image_count']
+        # One RNG for every image, timing and effect pick
+        self._rng = random.Random()
         
         # Store timing configurations with defaults
         self.portrait_timing = config.get('portrait_timing', '3-5 seconds')
         self.landscape_timing = config.get('landscape_timing', '2-4 seconds')
+        # Parsed once; the interval helpers run on every timer tick
+        self._portrait_range = self.parse_timing_range(self.portrait_timing)
+        self._landscape_range = self.parse_timing_range(self.landscape_timing)
         self.image_slots: List[ImageSlot] = []
         self.timers: List[QTimer] = []
         self.current_images: List[str] = [""] * self.image_count
@@ -532,6 +805,7 @@ class ImageViewer(QWidget):
         
         # Favorites management
         self.favorites_list: List[str] = []
+        self._favorites_set: set = set()  # same paths as favorites_list, for O(1) membership
         self.dedicated_slot_enabled = False
         self.dedicated_slot_auto_disabled = False  # Track if user manually disabled
         
@@ -546,6 +820,7 @@ class ImageViewer(QWidget):
         # Image categorization
         self.portrait_images: List[str] = []
         self.landscape_images: List[str] = []
+        self._orientation: dict = {}  # image path -> True if landscape
         self.categorize_images()
         
         # Landscape mode components (will be created in init_ui)
@@ -554,27 +829,34 @@ class ImageViewer(QWidget):
         self.landscape_width = 0
         self.landscape_height = 0
         self.landscape_image_count = 0  # Track how many landscape images shown
-        self.landscape_start_time = 0  # Track when landscape mode started
-        self.last_landscape_change_time = 0  # Track time between changes
+        self.landscape_clock = QElapsedTimer()  # Monotonic time since the landscape image was shown
         
         # Timer state preservation for better UX
-        self.portrait_timer_states: List[dict] = []  # Store timer states during landscape mode
+        # Portrait timer states saved during landscape mode, one entry per slot
+        self.saved_timer_remaining: List[int] = [0] * self.image_count
+        self.saved_timer_active: List[bool] = [False] * self.image_count
+        self.timer_states_saved = False
         self.landscape_source_slot_index = -1  # Track which slot triggered landscape mode
+        self._finalize_after_fade = False  # complete_portrait_transition is waiting for the fade-in
         
         # Preview mode tracking
         self.landscape_preview_pending = False  # Flag to prevent duplicate switches
         
         # Landscape播放管理系统
         self.landscape_lock = None  # 当前持锁的slot_index
-        self.landscape_lock_time = None  # 锁获取时间
+        self.landscape_lock_clock = QElapsedTimer()  # 锁获取后经过的时间（未持锁时无效）
         self.landscape_lock_stage = None  # 锁阶段: 'preview' 或 'playing'
-        self.landscape_queue = deque()  # 等待播放的landscape图片队列
+        self.landscape_queue = deque(maxlen=5)  # 等待播放的landscape图片队列（满时丢弃最旧的）
         self.last_landscape_slot = None  # 上一个播放landscape的槽位
         self.landscape_lock_timeout = 15000  # 15秒超时
-        self.force_release_timer = None  # 强制释放定时器
+        # 强制释放定时器（单个长期存在的定时器，每次授予锁时重新启动）
+        self.force_release_timer = QTimer(self)
+        self.force_release_timer.setSingleShot(True)
+        self.force_release_timer.timeout.connect(self._on_force_release_timeout)
+        self._force_release_holder: Optional[int] = None
         
         # 抢占机制相关
-        self.last_preemption_time = 0  # 上次抢占时间
+        self.preemption_clock = QElapsedTimer()  # 上次抢占后经过的时间
         self.preemption_cooldown = 5000  # 抢占冷却时间5秒
         self.preview_stage_duration = 2000  # 预览阶段持续时间2秒
         
@@ -587,44 +869,60 @@ class ImageViewer(QWidget):
         self._acquiring_lock = False
         
         # 待执行任务跟踪 - 用于取消delayed_landscape_switch
-        self.pending_landscape_tasks = {}  # slot_index -> QTimer object
+        # 每个槽位一个长期存在的定时器，图片路径作为载荷单独保存
+        self.landscape_switch_timers: List[QTimer] = []
+        self.landscape_switch_images: List[Optional[str]] = [None] * self.image_count
+        for i in range(self.image_count):
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(partial(self._execute_delayed_landscape_switch, i))
+            self.landscape_switch_timers.append(timer)
+        
+        # Background image loading
+        self.image_loader = ImageLoader(config.get('loader_workers', default_worker_count()))
+        self.image_loader.loaded.connect(self.on_image_loaded)
+        self.pending_slot_loads = {}  # slot_index -> (image path, target size, generation, initial) being loaded
+        self.slot_load_generation = [0] * self.image_count  # bumped by every slot load request
+        self.pending_landscape_load: Optional[tuple] = None  # (image path, target size, generation)
+        self.landscape_load_generation = 0
+        self._warm_after_initial = False  # landscape warm-up waits for the first slot images
+        
+        # Scaled pixmaps live in QPixmapCache (LRU by cost); plus one prefetched candidate per slot
+        QPixmapCache.setCacheLimit(_PIXMAP_CACHE_KB)
+        self.prefetched_images = {}  # slot_index -> deque of upcoming candidate image paths
+        
+        # Throttle images_changed: slots firing close together emit once per 50 ms
+        self._images_changed_timer = QTimer(self)
+        self._images_changed_timer.setSingleShot(True)
+        self._images_changed_timer.setInterval(50)
+        self._images_changed_timer.timeout.connect(self.images_changed.emit)
+        
+        # Coalesce bursts of resize events into one slot relayout
+        self._slot_dimensions_size = {}  # layout mode -> (width, height, dpr) its slots were sized for
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(40)
+        self._resize_timer.timeout.connect(self.calculate_slot_dimensions)
         
         self.init_ui()
         
     def parse_timing_range(self, timing_string: str) -> Tuple[int, int]:
         """Parse timing string to millisecond range tuple"""
-        timing_map = {
-            "2-4 seconds": (2000, 4000),
-            "3-5 seconds": (3000, 5000), 
-            "4-6 seconds": (4000, 6000),
-            "5-7 seconds": (5000, 7000),
-            "6-8 seconds": (6000, 8000)
-        }
-        return timing_map.get(timing_string, (3000, 5000))  # Default fallback
-        
-    def get_portrait_timing_range(self) -> Tuple[int, int]:
-        """Get portrait timing range in milliseconds"""
-        return self.parse_timing_range(self.portrait_timing)
-        
-    def get_landscape_timing_range(self) -> Tuple[int, int]:
-        """Get landscape timing range in milliseconds"""
-        return self.parse_timing_range(self.landscape_timing)
+        return _TIMING_MAP.get(timing_string, (3000, 5000))  # Default fallback
         
     def get_random_portrait_interval(self) -> int:
         """Get random interval for portrait mode"""
-        min_ms, max_ms = self.get_portrait_timing_range()
-        return random.randint(min_ms, max_ms)
+        return self._rng.randint(*self._portrait_range)
         
     def get_random_landscape_interval(self) -> int:
         """Get random interval for landscape mode"""
-        min_ms, max_ms = self.get_landscape_timing_range()
-        return random.randint(min_ms, max_ms)
+        return self._rng.randint(*self._landscape_range)
         
     def init_ui(self):
         # Set background color
         self.setAutoFillBackground(True)
         palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(10, 10, 10))
+        palette.setColor(QPalette.ColorRole.Window, _BG_COLOR)
         self.setPalette(palette)
         
         # Create stacked layout for switching between portrait and landscape modes
@@ -638,7 +936,7 @@ class ImageViewer(QWidget):
         
         # Create image slots for portrait mode
         for i in range(self.image_count):
-            slot = ImageSlot(i)
+            slot = ImageSlot(i, rng=self._rng)
             slot.clicked.connect(self.toggle_pin)  # Connect click signal
             slot.favorite_toggled.connect(self.on_favorite_toggled)  # Connect favorite signal
             self.image_slots.append(slot)
@@ -658,14 +956,16 @@ class ImageViewer(QWidget):
         landscape_layout.setSpacing(0)
         
         # Create single slot for landscape mode
-        self.landscape_slot = ImageSlot(99)  # Use 99 as special index for landscape
+        self.landscape_slot = ImageSlot(99, rng=self._rng)  # Use 99 as special index for landscape
         self.landscape_slot.clicked.connect(lambda: self.toggle_pin_landscape())
         self.landscape_slot.favorite_toggled.connect(self.on_favorite_toggled)  # Connect favorite signal
         landscape_layout.addWidget(self.landscape_slot)
         
         # Create timer for landscape slot
+        # Single shot: each landscape image is shown once, then we return to portrait mode
         self.landscape_timer = QTimer()
-        # Don't connect anything initially - will be connected when entering landscape mode
+        self.landscape_timer.setSingleShot(True)
+        self.landscape_timer.timeout.connect(self.change_landscape_image)
         
         self.landscape_widget.setLayout(landscape_layout)
         
@@ -693,6 +993,23 @@ class ImageViewer(QWidget):
         self.pause_label.setText("⏸ " + tr('paused'))
         self.pause_label.hide()
         
+        # Landscape snapshot faded out on the way back to portrait mode
+        self.landscape_fade_overlay = FadeOverlay(self)
+        self.landscape_fade_animation = QPropertyAnimation(self.landscape_fade_overlay, b"opacity", self)
+        self.landscape_fade_animation.setDuration(300)  # Faster fade
+        self.landscape_fade_animation.setStartValue(1.0)
+        self.landscape_fade_animation.setEndValue(0.3)  # Keep 30% visible during transition
+        self.landscape_fade_animation.finished.connect(self.complete_portrait_transition)
+        
+        # Portrait fade-in: a background-colored curtain over the portrait widget is
+        # faded out, one blit per frame instead of an opacity effect on every slot
+        self.portrait_fade_overlay = FadeOverlay(self)
+        self.portrait_fade_animation = QPropertyAnimation(self.portrait_fade_overlay, b"opacity", self)
+        self.portrait_fade_animation.setDuration(400)  # Slightly longer for smooth blend
+        self.portrait_fade_animation.setStartValue(1.0)
+        self.portrait_fade_animation.setEndValue(0.0)
+        self.portrait_fade_animation.finished.connect(self._on_portrait_fade_finished)
+        
     def showEvent(self, event):
         """Start display when widget is shown"""
         super().showEvent(event)
@@ -703,12 +1020,11 @@ class ImageViewer(QWidget):
         # Calculate slot dimensions
         self.calculate_slot_dimensions()
         
-        # Start with random selection from ALL images
-        available_images = self.image_files.copy()
-        random.shuffle(available_images)
+        # Start with random selection from ALL images (only the slots' worth is drawn)
+        available_images = self._rng.sample(self.image_files, min(self.image_count, len(self.image_files)))
         
         # Display initial images
-        for i in range(min(self.image_count, len(available_images))):
+        for i in range(len(available_images)):
             self.display_initial_image(i, available_images[i])
             
         # Start all timers immediately with different intervals
@@ -720,34 +1036,87 @@ class ImageViewer(QWidget):
                 # Other timers start with random portrait intervals
                 interval = self.get_random_portrait_interval()
                 self.timers[i].start(interval)
+        
+        # Once the first images are up, decode the landscape set ahead of time
+        self._warm_after_initial = self.config.get('warm_landscape_cache', True)
+        self._maybe_warm_landscape_cache()
+        
+    def _maybe_warm_landscape_cache(self):
+        """Start the landscape warm-up once no visible load is outstanding"""
+        # The warm-up queues the whole set; starting it earlier would put the
+        # first slot images behind it on the pool
+        if self._warm_after_initial and not self.pending_slot_loads and self.pending_landscape_load is None:
+            self._warm_after_initial = False
+            self._warm_landscape_cache()
+            
+    def _warm_landscape_cache(self):
+        """Decode every landscape image at landscape size in the background, if the set fits the cache"""
+        target_size = self.device_size(self.landscape_target_size())
+        image_kb = target_size[0] * target_size[1] * 4 // 1024
+        if not self.landscape_images or image_kb <= 0:
+            return
+        # A set larger than the budget would only evict itself (and the slot images)
+        if len(self.landscape_images) * image_kb > _LANDSCAPE_WARM_KB:
+            debug("Landscape set too large to warm: %d images at %dx%d",
+                  len(self.landscape_images), *target_size)
+            return
+        for image_path in self.landscape_images:
+            if self.get_cached_pixmap(image_path, target_size) is None:
+                self.start_load(image_path, target_size, PRIORITY_PREFETCH)
+        debug("Warming landscape cache: %d images at %dx%d",
+              len(self.landscape_images), *target_size)
             
     def calculate_slot_dimensions(self):
         """Calculate dimensions for each slot based on current mode"""
+        # Every mode switch calls this; skip it when this mode was already laid
+        # out for the current window size and screen (moving to a display with a
+        # different pixel ratio changes the device-pixel load sizes)
+        key = (self.width(), self.height(), self.devicePixelRatioF())
+        if self._slot_dimensions_size.get(self.current_layout_mode) == key:
+            return
+        self._slot_dimensions_size[self.current_layout_mode] = key
+        
         if self.current_layout_mode == LayoutMode.PORTRAIT:
             # Get available space for portrait mode
             total_width = self.width() - 40 - (15 * (self.image_count - 1))  # Minus margins and spacing
             total_height = self.height() - 40  # Minus margins
             
             # Calculate dimensions for each slot
+            old_size = self.slot_load_size()
             self.slot_width = total_width // self.image_count
             self.slot_height = total_height
-            
-            # Set minimum and maximum sizes for each slot to prevent growing
+            if old_size != self.slot_load_size() and old_size[0] > 0:
+                # Decodes at the old size would never be hit again; prefetch at the new one
+                self.evict_slot_images(old_size)
+                for index in range(len(self.image_slots)):
+                    self.schedule_prefetch(index)
+            
+            # Set minimum and maximum sizes for each slot to prevent growing.
+            # Qt already coalesces the layout requests these post into one pass;
+            # the 10 px slack (rather than setFixedSize) lets the window still shrink
             for slot in self.image_slots:
-                slot.setMinimumWidth(self.slot_width - 10)
-                slot.setMaximumWidth(self.slot_width + 10)
-                slot.setMinimumHeight(self.slot_height - 10)
-                slot.setMaximumHeight(self.slot_height + 10)
+                slot.setMinimumSize(self.slot_width - 10, self.slot_height - 10)
+                slot.setMaximumSize(self.slot_width + 10, self.slot_height + 10)
         else:
             # Landscape mode - use full width and height
-            self.landscape_width = self.width() - 40
-            self.landscape_height = self.height() - 40
+            self.landscape_width, self.landscape_height = self.landscape_target_size()
             
             if self.landscape_slot:
-                self.landscape_slot.setMinimumWidth(self.landscape_width - 10)
-                self.landscape_slot.setMaximumWidth(self.landscape_width + 10)
-                self.landscape_slot.setMinimumHeight(self.landscape_height - 10)
-                self.landscape_slot.setMaximumHeight(self.landscape_height + 10)
+                self.landscape_slot.setMinimumSize(self.landscape_width - 10, self.landscape_height - 10)
+                self.landscape_slot.setMaximumSize(self.landscape_width + 10, self.landscape_height + 10)
+            
+    def landscape_target_size(self) -> Tuple[int, int]:
+        """Size of the landscape slot for the current window size"""
+        return (self.width() - 40, self.height() - 40)  # Minus margins
+        
+    def device_size(self, size: Tuple[int, int]) -> Tuple[int, int]:
+        """A logical size in device pixels; images are decoded at this size so HiDPI screens don't upscale them"""
+        dpr = self.devicePixelRatioF()
+        return (round(size[0] * dpr), round(size[1] * dpr))
+        
+    def slot_load_size(self) -> Tuple[int, int]:
+        """Decode size for portrait slot images"""
+        return self.device_size((self.slot_width, self.slot_height))
             
     def display_initial_image(self, index: int, image_path: str):
         """Display initial image with landscape lock check"""
@@ -756,41 +1125,25 @@ class ImageViewer(QWidget):
         
         # 检查是否为landscape并通过锁系统
         if self.is_landscape_image(image_path):
-            debug(f"Initial image {os.path.basename(image_path)} is landscape in slot {index}")
+            debug("Initial image %s is landscape in slot %s", os.path.basename(image_path), index)
             # 收藏专栏使用优先级
             priority = (index == 0 and self.dedicated_slot_enabled)
             if self.acquire_landscape_lock(index, priority=priority):
-                debug(f"Slot {index} acquired lock for initial landscape")
-                # 成功获取锁，显示landscape并开始预览流程
-                pixmap = self.load_image_for_display(image_path)
-                if pixmap:
-                    self.image_slots[index].show_image(image_path, pixmap, initial=True)
-                    # 初始landscape也需要预览和切换流程
-                    self.landscape_preview_pending = True
-                    self._schedule_landscape_switch(index, image_path)
-                    # 停止定时器，防止在预览期间改变图片
-                    self.timers[index].stop()
-                    # Set favorite state if applicable
-                    if image_path in self.favorites_list:
-                        self.image_slots[index].set_favorited(True)
+                debug("Slot %s acquired lock for initial landscape", index)
+                # 成功获取锁，显示landscape并开始预览流程（初始landscape也需要预览和切换）
+                self._start_landscape_preview(index, image_path, initial=True)
                 return
             else:
-                debug(f"Slot {index} failed to acquire lock, selecting portrait instead")
+                debug("Slot %s failed to acquire lock, selecting portrait instead", index)
                 # 获取锁失败，重新选择portrait图片
-                portrait_imgs = [img for img in self.image_files 
-                               if self.is_portrait_image(img) and img != original_image]
-                if portrait_imgs:
-                    image_path = random.choice(portrait_imgs)
+                portrait_img = self.pick_random_image(self.portrait_images, {original_image})
+                if portrait_img:
+                    image_path = portrait_img
                     self.current_images[index] = image_path
-                    debug(f"Slot {index} switched to portrait: {os.path.basename(image_path)}")
+                    debug("Slot %s switched to portrait: %s", index, os.path.basename(image_path))
         
-        # 显示最终图片（portrait或获得锁的landscape已经显示了）
-        pixmap = self.load_image_for_display(image_path)
-        if pixmap:
-            self.image_slots[index].show_image(image_path, pixmap, initial=True)
-            # Set favorite state if applicable
-            if image_path in self.favorites_list:
-                self.image_slots[index].set_favorited(True)
+        # 显示最终图片（portrait或获得锁的landscape已经显示了），后台加载
+        self.request_slot_image(index, image_path, initial=True)
             
     def start_timer(self, index: int):
         """Start timer for specific slot"""
@@ -799,9 +1152,10 @@ class ImageViewer(QWidget):
         self.timers[index].start(interval)
         
     def stop(self):
-        """Stop all timers"""
+        """Stop all timers and background loads"""
         for timer in self.timers:
             timer.stop()
+        self.image_loader.shutdown()
             
     def pause(self):
         """Pause all image changes"""
@@ -828,11 +1182,13 @@ class ImageViewer(QWidget):
             self.pause_label.hide()
             # Restart timers based on current mode
             if self.current_layout_mode == LayoutMode.PORTRAIT:
-                for i in range(len(self.timers)):
-                    # Only restart timer if slot is not pinned
-                    if i < len(self.image_slots) and not self.image_slots[i].is_pinned:
-                        interval = self.get_random_portrait_interval()
-                        self.timers[i].start(interval)
+                # Only restart timers of slots that are not pinned
+                unpinned = [i for i in range(min(len(self.timers), len(self.image_slots)))
+                            if not self.image_slots[i].is_pinned]
+                min_ms, max_ms = self._portrait_range
+                # Stagger the restarts so no two slots decode at the same moment
+                for n, i in enumerate(unpinned):
+                    self.timers[i].start(self._rng.randint(min_ms, max_ms) + n * _RESUME_STAGGER_MS)
             else:
                 # In landscape mode, check if landscape slot is pinned
                 if self.landscape_slot and not self.landscape_slot.is_pinned:
@@ -848,10 +1204,11 @@ class ImageViewer(QWidget):
             self.pause_label.move(x, y)
             self.pause_label.raise_()
             
-    def load_image_for_display(self, image_path: str) -> Optional[QPixmap]:
-        """Load and scale image for slot size"""
-        # Use full slot dimensions to maximize image size
-        return load_and_scale_image(image_path, (self.slot_width, self.slot_height), maintain_aspect=True)
+    def _reset_slot(self, index: int):
+        """Show a new image in a slot now and restart its timer"""
+        # Start the timer first: a landscape preview stops it again until its flow is done
+        self.timers[index].start(self.get_random_portrait_interval())
+        self.change_single_image(index)
         
     @pyqtSlot()
     def change_single_image(self, index: int):
@@ -866,18 +1223,21 @@ class ImageViewer(QWidget):
             self.timers[index].start(self.get_random_portrait_interval())
             return
             
+        # A timeout already queued when pausing must not change the image
+        if self.is_paused:
+            return
+            
         # 新的landscape管理系统
         new_image = None
+        current_set = set(self.current_images)
         
         # 收藏专栏特殊处理
         if index == 0 and self.dedicated_slot_enabled and self.favorites_list:
-            # 只从收藏中选择
-            available = [img for img in self.favorites_list if img not in self.current_images]
-            if not available:
-                available = [img for img in self.favorites_list if img != self.current_images[index]]
+            # 只从收藏中选择（拒绝采样，不为每次切换复制整个收藏列表）
+            new_image = (self.pick_random_image(self.favorites_list, current_set)
+                         or self.pick_random_image(self.favorites_list, {self.current_images[index]}))
             
-            if available:
-                new_image = random.choice(available)
+            if new_image:
                 self.current_images[index] = new_image
                 
                 # 收藏专栏的landscape处理（独立于全局系统）
@@ -885,55 +1245,39 @@ class ImageViewer(QWidget):
                     # 直接尝试获取锁，收藏专栏使用优先级
                     if self.acquire_landscape_lock(0, priority=True):
                         # 成功获取锁，开始landscape预览流程
-                        self.landscape_preview_pending = True
-                        pixmap = self.load_image_for_display(new_image)
-                        if pixmap:
-                            self.image_slots[index].show_image(new_image, pixmap, initial=False)
-                            self.images_changed.emit()
-                        
-                        self._schedule_landscape_switch(index, new_image)
-                        # 停止定时器，直到landscape流程完全结束
-                        self.timers[index].stop()
+                        self._start_landscape_preview(index, new_image)
                         return
                     else:
                         # 获取锁失败，强制选择portrait图片
-                        portrait_imgs = [img for img in available if self.is_portrait_image(img)]
+                        portrait_imgs = [img for img in self.favorites_list
+                                         if img not in current_set and self.is_portrait_image(img)]
                         if portrait_imgs:
-                            new_image = random.choice(portrait_imgs)
+                            new_image = self._rng.choice(portrait_imgs)
                             self.current_images[index] = new_image
         else:
             # 普通槽位处理
             # 1. 优先检查队列中的landscape
             if self.landscape_queue:
                 landscape_img = self.landscape_queue.popleft()
-                if os.path.exists(landscape_img):
+                if landscape_img in self._existing_files:
                     # 直接尝试获取锁
                     if self.acquire_landscape_lock(index):
                         new_image = landscape_img
                         self.current_images[index] = new_image
                         
                         # 开始landscape预览
-                        self.landscape_preview_pending = True
-                        pixmap = self.load_image_for_display(new_image)
-                        if pixmap:
-                            self.image_slots[index].show_image(new_image, pixmap, initial=False)
-                            self.images_changed.emit()
-                        
-                        self._schedule_landscape_switch(index, new_image)
-                        # 停止定时器，直到landscape流程完全结束
-                        self.timers[index].stop()
+                        self._start_landscape_preview(index, new_image)
                         return
                     else:
                         # 获取锁失败，重新放回队列
                         self.landscape_queue.appendleft(landscape_img)
             
-            # 2. 随机选择新图片
-            available = [img for img in self.image_files if img not in self.current_images]
-            if not available:
-                available = [img for img in self.image_files if img != self.current_images[index]]
+            # 2. 随机选择新图片（优先使用已预取的候选图片）
+            new_image = (self.take_prefetched_image(index, current_set)
+                         or self.pick_random_image(self.image_files, current_set)
+                         or self.pick_random_image(self.image_files, {self.current_images[index]}))
             
-            if available:
-                new_image = random.choice(available)
+            if new_image:
                 self.current_images[index] = new_image
                 
                 # 3. 处理新选择的landscape图片
@@ -941,20 +1285,11 @@ class ImageViewer(QWidget):
                     # 直接尝试获取锁
                     if self.acquire_landscape_lock(index):
                         # 成功获取锁，立即播放
-                        self.landscape_preview_pending = True
-                        pixmap = self.load_image_for_display(new_image)
-                        if pixmap:
-                            self.image_slots[index].show_image(new_image, pixmap, initial=False)
-                            self.images_changed.emit()
-                        
-                        self._schedule_landscape_switch(index, new_image)
-                        # 停止定时器，直到landscape流程完全结束
-                        self.timers[index].stop()
+                        self._start_landscape_preview(index, new_image)
                         return
                     else:
                         # 获取锁失败，加入队列并选择portrait
-                        if len(self.landscape_queue) < 5:
-                            self.landscape_queue.append(new_image)
+                        self.landscape_queue.append(new_image)
                         
                         # 重新选择portrait图片
                         portrait_img = self.get_random_portrait_image(self.current_images)
@@ -962,29 +1297,141 @@ class ImageViewer(QWidget):
                             new_image = portrait_img
                             self.current_images[index] = new_image
         
-        # 显示最终选择的图片
+        # 显示最终选择的图片（后台加载，完成后显示）
         if new_image:
-            pixmap = self.load_image_for_display(new_image)
-            if pixmap:
-                self.image_slots[index].show_image(new_image, pixmap, initial=False)
-                # Update favorite state
-                if new_image in self.favorites_list:
-                    self.image_slots[index].set_favorited(True)
-                else:
-                    self.image_slots[index].set_favorited(False)
-                self.images_changed.emit()
+            self.request_slot_image(index, new_image)
                 
         # Reset timer with new random interval
         self.timers[index].stop()
         interval = self.get_random_portrait_interval()
         self.timers[index].start(interval)
         
+    def _start_landscape_preview(self, index: int, image_path: str, initial: bool = False):
+        """Preview a landscape image in its slot, then switch to landscape mode"""
+        self.landscape_preview_pending = True
+        # Decoded in the background like any slot image; the switch countdown runs meanwhile
+        self.request_slot_image(index, image_path, initial)
+        self._schedule_landscape_switch(index, image_path)
+        # 停止定时器，直到landscape流程完全结束
+        self.timers[index].stop()
+        
+    def request_slot_image(self, index: int, image_path: str, initial: bool = False):
+        """Load an image for a slot in the background and show it when ready"""
+        # Each request supersedes any load still in flight for this slot
+        self.slot_load_generation[index] += 1
+        target_size = self.slot_load_size()
+        pixmap = self.get_cached_pixmap(image_path, target_size)
+        if pixmap:
+            self.pending_slot_loads.pop(index, None)
+            self.show_slot_image(index, image_path, pixmap, initial)
+            return
+        self.pending_slot_loads[index] = (image_path, target_size, self.slot_load_generation[index], initial)
+        self.start_load(image_path, target_size)
+        
+    def start_load(self, image_path: str, target_size: Tuple[int, int], priority: int = PRIORITY_VISIBLE):
+        """Start a background load; the loader merges it with the same load already queued"""
+        # A visible request for a load queued as a prefetch moves it ahead of the prefetches
+        self.image_loader.load(image_path, target_size, priority)
+        
+    def get_cached_pixmap(self, image_path: str, target_size: Tuple[int, int]) -> Optional[QPixmap]:
+        """Look up a scaled pixmap in the shared pixmap cache"""
+        key = _pixmap_cache_key(image_path, target_size)
+        return QPixmapCache.find(key) if key else None
+        
+    def cache_pixmap(self, image_path: str, target_size: Tuple[int, int], pixmap: QPixmap):
+        """Insert a scaled pixmap into the shared pixmap cache"""
+        key = _pixmap_cache_key(image_path, target_size)
+        if key:
+            QPixmapCache.insert(key, pixmap)
+        
+    def schedule_prefetch(self, index: int):
+        """Pick the slot's next images now and decode them ahead of its timer"""
+        if index == 0 and self.dedicated_slot_enabled:
+            return  # Favorites slot picks from its own list
+        queue = self.prefetched_images.setdefault(index, deque())
+        # Keep candidates distinct from what is on screen and queued for other slots
+        exclude = set(self.current_images).union(*self.prefetched_images.values())
+        while len(queue) < _PREFETCH_DEPTH:
+            candidate = self.pick_random_image(self.image_files, exclude)
+            if not candidate:
+                break
+            queue.append(candidate)
+            exclude.add(candidate)
+        target_size = self.slot_load_size()
+        for candidate in queue:
+            if self.get_cached_pixmap(candidate, target_size) is None:
+                self.start_load(candidate, target_size, PRIORITY_PREFETCH)
+                
+    def take_prefetched_image(self, index: int, exclude: set) -> Optional[str]:
+        """Next prefetched candidate for a slot that is not in exclude, if any"""
+        queue = self.prefetched_images.get(index)
+        while queue:
+            candidate = queue.popleft()
+            if candidate not in exclude:
+                return candidate
+        return None
+        
+    def evict_slot_images(self, target_size: Tuple[int, int]):
+        """Drop the on-screen and prefetched slot images decoded at a size no longer used"""
+        for image_path in set(self.current_images).union(*self.prefetched_images.values()):
+            key = _pixmap_cache_key(image_path, target_size)
+            if key:
+                QPixmapCache.remove(key)
+        
+    def show_slot_image(self, index: int, image_path: str, pixmap: QPixmap, initial: bool = False):
+        """Show a loaded image in a slot and prefetch the slot's next one"""
+        self.image_slots[index].show_image(image_path, pixmap, initial=initial)
+        # Update favorite state
+        self._apply_favorite_state(self.image_slots[index], image_path)
+        self.notify_images_changed()
+        self.schedule_prefetch(index)
+        
+    def notify_images_changed(self):
+        """Emit images_changed at the end of the current 50 ms window"""
+        if not self._images_changed_timer.isActive():
+            self._images_changed_timer.start()
+        
+    def _apply_favorite_state(self, slot: ImageSlot, image_path: str):
+        """Sync a slot's favorite icon with the favorites, skipping no-op updates"""
+        favorited = image_path in self._favorites_set
+        if slot.is_favorited != favorited:
+            slot.set_favorited(favorited)
+        
+    @pyqtSlot(str, tuple, QPixmap)
+    def on_image_loaded(self, image_path: str, target_size: tuple, pixmap: QPixmap):
+        """Cache a background-loaded image and show it in slots waiting for it"""
+        if not pixmap.isNull():
+            self.cache_pixmap(image_path, target_size, pixmap)
+        if self.pending_landscape_load and self.pending_landscape_load[:2] == (image_path, target_size):
+            generation = self.pending_landscape_load[2]
+            self.pending_landscape_load = None
+            # Drop results superseded by a newer request or by leaving landscape mode
+            if generation == self.landscape_load_generation and self.current_layout_mode == LayoutMode.LANDSCAPE:
+                if not pixmap.isNull():
+                    self.show_landscape_image(image_path, pixmap)
+                else:
+                    # Nothing to show, and the landscape timer only starts once an image is up
+                    warning(f"Could not load landscape image {image_path}, returning to portrait mode")
+                    self.switch_to_portrait_mode()
+        for index, (pending_path, pending_size, generation, initial) in list(self.pending_slot_loads.items()):
+            # The same file may also be decoding at landscape size; only the slot-size result counts
+            if (pending_path, pending_size) != (image_path, target_size):
+                continue
+            del self.pending_slot_loads[index]
+            # Drop results for slots that moved on while the image was loading
+            if (pixmap.isNull() or generation != self.slot_load_generation[index]
+                    or self.current_images[index] != image_path):
+                continue
+            self.show_slot_image(index, image_path, pixmap, initial)
+        self._maybe_warm_landscape_cache()
+        
     def resizeEvent(self, event):
         """Handle window resize"""
         super().resizeEvent(event)
-        # Recalculate dimensions
+        # Recalculate dimensions once the resize burst settles (window drags
+        # deliver one event per pixel, each re-constraining every slot)
         if hasattr(self, 'image_slots') and self.image_slots:
-            self.calculate_slot_dimensions()
+            self._resize_timer.start()
         # Reposition pause label if visible
         if self.is_paused and self.pause_label:
             self.position_pause_label()
@@ -997,7 +1444,7 @@ class ImageViewer(QWidget):
             slot.set_pinned(not slot.is_pinned)
             
             # If we just pinned the image, restore its favorite state
-            if slot.is_pinned and slot.current_image_path in self.favorites_list:
+            if slot.is_pinned and slot.current_image_path in self._favorites_set:
                 slot.set_favorited(True)
             
     def set_display_mode(self, mode: DisplayMode):
@@ -1009,19 +1456,36 @@ class ImageViewer(QWidget):
             
     def categorize_images(self):
         """Categorize images by orientation"""
-        for img_path in self.image_files:
-            try:
-                # Use PIL to get image dimensions without loading full image
-                with Image.open(img_path) as img:
-                    width, height = img.size
-                    if width > height:
-                        self.landscape_images.append(img_path)
-                    else:
-                        self.portrait_images.append(img_path)
-            except Exception as e:
-                error(f"Error checking image {img_path}: {e}")
-                # Assume portrait if can't determine
-                self.portrait_images.append(img_path)
+        # Files found by the directory scan; stands in for os.path.exists in the timer path
+        self._existing_files = set(self.image_files)
+        # Orientations of unchanged files are remembered across runs
+        cache = load_orientation_cache()
+        new_entries = {}
+        # Header reads are I/O bound (PIL releases the GIL), so probe in parallel
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(partial(_probe_orientation_cached, cache),
+                                   self.image_files, chunksize=32)
+            for img_path, is_landscape, exc, entry, signature in results:
+                if exc is not None:
+                    error(f"Error checking image {img_path}: {exc}")
+                if signature is not None:
+                    _file_mtimes[img_path] = signature[0]
+                if entry is not None:
+                    new_entries[img_path] = entry
+                if is_landscape:
+                    self.landscape_images.append(img_path)
+                else:
+                    self.portrait_images.append(img_path)
+                self._orientation[img_path] = is_landscape
+        
+        # Entries for other image sets are kept while their files exist, so switching
+        # sets stays cached; the file is only rewritten when something changed
+        cache.update(new_entries)
+        pruned = prune_orientation_cache(cache, self._existing_files)
+        if new_entries or pruned:
+            save_orientation_cache(cache)
+            debug("Cached orientation of %d new or changed images, dropped %d stale entries",
+                  len(new_entries), pruned)
                 
         info(f"Total images: {len(self.image_files)} ({len(self.portrait_images)} portrait, {len(self.landscape_images)} landscape)")
         info("Using true random selection from all images")
@@ -1029,8 +1493,10 @@ class ImageViewer(QWidget):
         # Show source directories info
         if 'images_dirs' in self.config:
             info(f"Images loaded from {len(self.config['images_dirs'])} directories:")
+            # Directory scans aren't recursive, so each file belongs to its parent dir
+            dir_counts = Counter(os.path.normpath(os.path.dirname(f)) for f in self.image_files)
             for dir_path in self.config['images_dirs']:
-                dir_count = len([f for f in self.image_files if f.startswith(dir_path)])
+                dir_count = dir_counts.get(os.path.normpath(dir_path), 0)
                 info(f"  - {dir_path}: {dir_count} images")
         
     def on_cooldown_finished(self):
@@ -1044,23 +1510,20 @@ class ImageViewer(QWidget):
             self.landscape_slot.set_pinned(not self.landscape_slot.is_pinned)
             
             # If we just pinned the image, restore its favorite state
-            if self.landscape_slot.is_pinned and self.landscape_slot.current_image_path in self.favorites_list:
+            if self.landscape_slot.is_pinned and self.landscape_slot.current_image_path in self._favorites_set:
                 self.landscape_slot.set_favorited(True)
             
     def change_landscape_image(self):
         """Called when landscape timer expires - always return to portrait mode"""
-        current_time = time.time()
-        if self.last_landscape_change_time > 0:
-            time_since_last = current_time - self.last_landscape_change_time
-            debug(f"Landscape timer expired at {current_time:.2f}, {time_since_last:.2f}s since image shown")
+        if self.landscape_clock.isValid():
+            debug("Landscape timer expired, %.2fs since image shown", self.landscape_clock.elapsed() / 1000)
         
         # Check if landscape image is pinned
         if self.landscape_slot.is_pinned:
             debug("Landscape image is pinned, staying in landscape mode")
             # Restart timer to check again later
-            self.landscape_timer.setSingleShot(True)
             interval = self.get_random_landscape_interval()
-            debug(f"Restarting timer with interval: {interval}ms")
+            debug("Restarting timer with interval: %sms", interval)
             self.landscape_timer.start(interval)
             return
         
@@ -1070,20 +1533,25 @@ class ImageViewer(QWidget):
             
     def delayed_landscape_switch(self, image_path: str, slot_index: int):
         """Execute landscape switch after preview delay"""
-        debug(f"Executing delayed landscape switch from slot {slot_index}")
+        debug("Executing delayed landscape switch from slot %s", slot_index)
         
         # 多重状态验证确保原子性
         if self.landscape_lock != slot_index:
             warning(f"Slot {slot_index} lost landscape lock during preview, aborting switch")
+            self._restart_aborted_slot_timer(slot_index)
             return
             
         if self.landscape_lock_stage != 'preview':
             warning(f"Lock stage is {self.landscape_lock_stage}, expected 'preview', aborting switch")
+            self._restart_aborted_slot_timer(slot_index)
             return
             
-        if slot_index >= len(self.image_slots) or self.image_slots[slot_index].current_image_path != image_path:
+        # current_images is set when the preview is requested; the slot itself only
+        # learns the path once the background decode has been shown
+        if slot_index >= len(self.image_slots) or self.current_images[slot_index] != image_path:
             warning(f"Slot {slot_index} image changed during preview, aborting switch")
             self.release_landscape_lock(slot_index)
+            self._restart_aborted_slot_timer(slot_index)
             return
             
         # 清除预览状态
@@ -1093,50 +1561,93 @@ class ImageViewer(QWidget):
         if not self.transition_in_progress and self.current_layout_mode == LayoutMode.PORTRAIT:
             # 进入播放阶段，设置锁阶段为playing，防止被抢占
             self.landscape_lock_stage = 'playing'
-            debug(f"Slot {slot_index} entering landscape playing stage")
+            debug("Slot %s entering landscape playing stage", slot_index)
             self.switch_to_landscape_mode_with_image(image_path, slot_index)
         else:
             # 条件不满足，释放锁并切换到portrait
-            debug(f"Slot {slot_index} landscape switch conditions not met (transition: {self.transition_in_progress}, mode: {self.current_layout_mode})")
+            debug("Slot %s landscape switch conditions not met (transition: %s, mode: %s)",
+                  slot_index, self.transition_in_progress, self.current_layout_mode)
             self.release_landscape_lock(slot_index)
             self.force_slot_to_portrait(slot_index)
+            self._restart_aborted_slot_timer(slot_index)
+            
+    def _restart_aborted_slot_timer(self, slot_index: int):
+        """Restart the timer _start_landscape_preview stopped, once the switch is abandoned"""
+        # Outside portrait mode finalize_portrait_transition restarts every slot timer
+        if (slot_index < len(self.timers) and not self.transition_in_progress
+                and self.current_layout_mode == LayoutMode.PORTRAIT):
+            self.start_timer(slot_index)
     
-    def load_landscape_image(self, image_path: str) -> Optional[QPixmap]:
-        """Load and scale landscape image"""
-        return load_and_scale_image(image_path, (self.landscape_width, self.landscape_height), maintain_aspect=True)
+    def request_landscape_image(self, image_path: str):
+        """Load a landscape image in the background and show it when ready"""
+        # Each request supersedes any landscape load still in flight
+        self.landscape_load_generation += 1
+        target_size = self.device_size((self.landscape_width, self.landscape_height))
+        pixmap = self.get_cached_pixmap(image_path, target_size)
+        if pixmap:
+            self.pending_landscape_load = None
+            self.show_landscape_image(image_path, pixmap)
+            return
+        # Don't leave the previous landscape frame (and its favorite target) up meanwhile
+        self.landscape_slot.clear_image()
+        self.pending_landscape_load = (image_path, target_size, self.landscape_load_generation)
+        self.start_load(image_path, target_size)
+        
+    def show_landscape_image(self, image_path: str, pixmap: QPixmap):
+        """Show a loaded image in the landscape slot and start its display time"""
+        self.landscape_slot.show_image(image_path, pixmap, initial=True)
+        self.landscape_image_count = 1
+        # Set favorite state if applicable
+        self._apply_favorite_state(self.landscape_slot, image_path)
+        
+        # Start the single-shot timer to switch back to portrait after showing this landscape image;
+        # while paused, resume starts it
+        self.landscape_clock.start()
+        if not self.is_paused:
+            interval = self.get_random_landscape_interval()
+            debug("Starting landscape timer with interval: %sms (will switch to portrait after)", interval)
+            self.landscape_timer.start(interval)
     
     def is_portrait_image(self, image_path: str) -> bool:
         """Check if image is portrait (height >= width)"""
-        try:
-            with Image.open(image_path) as img:
-                width, height = img.size
-                return height >= width  # Portrait or square
-        except Exception:
-            return True  # Default to portrait if can't check
+        return not self.is_landscape_image(image_path)
             
     def is_landscape_image(self, image_path: str) -> bool:
         """Check if image is landscape (width > height)"""
-        try:
-            with Image.open(image_path) as img:
-                width, height = img.size
-                return width > height
-        except Exception:
-            return False  # Default to portrait if can't check
+        # Orientation was read once by categorize_images
+        is_landscape = self._orientation.get(image_path)
+        if is_landscape is None:
+            # Not from the scanned directories (e.g. a favorite saved from elsewhere):
+            # read the header once and remember it; unreadable images count as portrait
+            _, is_landscape, exc = _probe_orientation(image_path)
+            if exc is not None:
+                error(f"Error checking image {image_path}: {exc}")
+            self._orientation[image_path] = is_landscape
+        return is_landscape
             
     def get_random_portrait_image(self, exclude_current=None) -> Optional[str]:
         """Get a random portrait image, excluding current images"""
-        portrait_images = [img for img in self.image_files 
-                          if self.is_portrait_image(img)]
-        if exclude_current:
-            portrait_images = [img for img in portrait_images 
-                             if img not in exclude_current]
-        return random.choice(portrait_images) if portrait_images else None
+        return self.pick_random_image(self.portrait_images, set(exclude_current or ()))
+        
+    def pick_random_image(self, pool: List[str], exclude: set) -> Optional[str]:
+        """Pick a random image from pool that is not in exclude"""
+        if not pool:
+            return None
+        # Rejection sampling: exclude is a handful of on-screen images, so a few
+        # draws almost always succeed without building a filtered copy of pool
+        for _ in range(8):
+            candidate = self._rng.choice(pool)
+            if candidate not in exclude:
+                return candidate
+        # Pool mostly excluded (small library): filter it instead
+        remaining = [img for img in pool if img not in exclude]
+        return self._rng.choice(remaining) if remaining else None
         
     def acquire_landscape_lock(self, slot_index: int, priority: bool = False) -> bool:
         """获取landscape锁，支持优先级和抢占机制"""
         # 防止并发锁获取
         if self._acquiring_lock:
-            debug(f"Slot {slot_index} blocked by concurrent lock acquisition")
+            debug("Slot %s blocked by concurrent lock acquisition", slot_index)
             return False
             
         self._acquiring_lock = True
@@ -1146,7 +1657,7 @@ class ImageViewer(QWidget):
             if (self.current_layout_mode != LayoutMode.PORTRAIT or
                 self.transition_in_progress or
                 slot_index == self.last_landscape_slot):
-                debug(f"Slot {slot_index} lock acquisition failed - basic conditions not met")
+                debug("Slot %s lock acquisition failed - basic conditions not met", slot_index)
                 return False
             
             # 如果没有锁被持有，直接获取
@@ -1156,11 +1667,11 @@ class ImageViewer(QWidget):
             
             # 如果有锁被持有，检查是否可以抢占
             if priority and self._can_preempt(slot_index):
-                debug(f"Slot {slot_index} (favorites) preempting slot {self.landscape_lock}")
+                debug("Slot %s (favorites) preempting slot %s", slot_index, self.landscape_lock)
                 self._preempt_lock(slot_index)
                 return True
             
-            debug(f"Slot {slot_index} lock acquisition failed - lock held by slot {self.landscape_lock}")
+            debug("Slot %s lock acquisition failed - lock held by slot %s", slot_index, self.landscape_lock)
             return False
             
         finally:
@@ -1169,23 +1680,25 @@ class ImageViewer(QWidget):
     def _grant_lock(self, slot_index: int):
         """授予锁给指定槽位"""
         # 取消之前的强制释放定时器（如果存在）
-        if self.force_release_timer is not None:
+        if self.force_release_timer.isActive():
             self.force_release_timer.stop()
-            self.force_release_timer = None
-            debug(f"Cancelled previous force-release timer")
+            debug("Cancelled previous force-release timer")
         
         self.landscape_lock = slot_index
-        self.landscape_lock_time = time.time()
+        self.landscape_lock_clock.start()
         self.landscape_lock_stage = 'preview'
         self.last_landscape_slot = slot_index
         
-        debug(f"Slot {slot_index} successfully acquired landscape lock")
+        debug("Slot %s successfully acquired landscape lock", slot_index)
         
         # 设置超时自动释放
-        self.force_release_timer = QTimer()
-        self.force_release_timer.setSingleShot(True)
-        self.force_release_timer.timeout.connect(lambda: self.force_release_lock(slot_index))
+        self._force_release_holder = slot_index
         self.force_release_timer.start(self.landscape_lock_timeout)
+        
+    def _on_force_release_timeout(self):
+        """强制释放定时器到期"""
+        if self._force_release_holder is not None:
+            self.force_release_lock(self._force_release_holder)
     
     def _can_preempt(self, slot_index: int) -> bool:
         """检查是否可以抢占当前锁"""
@@ -1194,9 +1707,8 @@ class ImageViewer(QWidget):
             return False
         
         # 检查抢占冷却
-        current_time = time.time() * 1000
-        if current_time - self.last_preemption_time < self.preemption_cooldown:
-            debug(f"Preemption blocked by cooldown")
+        if self.preemption_clock.isValid() and self.preemption_clock.elapsed() < self.preemption_cooldown:
+            debug("Preemption blocked by cooldown")
             return False
         
         # 只能抢占普通专栏（非收藏专栏）
@@ -1205,13 +1717,13 @@ class ImageViewer(QWidget):
         
         # 只能在预览阶段抢占
         if self.landscape_lock_stage != 'preview':
-            debug(f"Cannot preempt - current stage: {self.landscape_lock_stage}")
+            debug("Cannot preempt - current stage: %s", self.landscape_lock_stage)
             return False
         
         # 检查预览时间是否还在允许范围内
-        elapsed_time = (time.time() - self.landscape_lock_time) * 1000
+        elapsed_time = self.landscape_lock_clock.elapsed()
         if elapsed_time >= self.preview_stage_duration:
-            debug(f"Cannot preempt - preview stage expired ({elapsed_time:.0f}ms)")
+            debug("Cannot preempt - preview stage expired (%dms)", elapsed_time)
             return False
         
         return True
@@ -1225,7 +1737,7 @@ class ImageViewer(QWidget):
             self.force_slot_to_portrait(preempted_slot)
         
         # 更新抢占时间
-        self.last_preemption_time = time.time() * 1000
+        self.preemption_clock.start()
         
         # 取消被抢占槽位的待执行任务
         self._cancel_pending_task(preempted_slot)
@@ -1238,32 +1750,32 @@ class ImageViewer(QWidget):
         # 先取消该槽位现有的待执行任务
         self._cancel_pending_task(slot_index)
         
-        # 创建新的定时器
-        timer = QTimer()
-        timer.setSingleShot(True)
-        timer.timeout.connect(lambda: self._execute_delayed_landscape_switch(slot_index, image_path))
-        
-        # 记录任务
-        self.pending_landscape_tasks[slot_index] = timer
+        # 记录任务并启动该槽位的定时器
+        self.landscape_switch_images[slot_index] = image_path
+        self.landscape_switch_timers[slot_index].start(delay_ms)
         
-        # 启动定时器
-        timer.start(delay_ms)
-        debug(f"Scheduled landscape switch for slot {slot_index} in {delay_ms}ms")
+        # 预览期间在后台按landscape尺寸预解码，切换时直接命中缓存
+        # （2秒内必须完成，排在预取和预热之前）
+        target_size = self.device_size(self.landscape_target_size())
+        if self.get_cached_pixmap(image_path, target_size) is None:
+            self.start_load(image_path, target_size, PRIORITY_UPCOMING)
+        debug("Scheduled landscape switch for slot %s in %sms", slot_index, delay_ms)
     
     def _cancel_pending_task(self, slot_index: int):
         """取消指定槽位的待执行任务"""
-        if slot_index in self.pending_landscape_tasks:
-            timer = self.pending_landscape_tasks[slot_index]
-            if timer.isActive():
-                timer.stop()
-                debug(f"Cancelled pending landscape task for slot {slot_index}")
-            del self.pending_landscape_tasks[slot_index]
+        timer = self.landscape_switch_timers[slot_index]
+        if timer.isActive():
+            timer.stop()
+            debug("Cancelled pending landscape task for slot %s", slot_index)
+        self.landscape_switch_images[slot_index] = None
     
-    def _execute_delayed_landscape_switch(self, slot_index: int, image_path: str):
+    def _execute_delayed_landscape_switch(self, slot_index: int):
         """执行延迟的landscape切换"""
-        # 清理任务记录
-        if slot_index in self.pending_landscape_tasks:
-            del self.pending_landscape_tasks[slot_index]
+        # 取出并清理任务记录
+        image_path = self.landscape_switch_images[slot_index]
+        self.landscape_switch_images[slot_index] = None
+        if image_path is None:
+            return
         
         # 执行原有的delayed_landscape_switch逻辑
         self.delayed_landscape_switch(image_path, slot_index)
@@ -1274,16 +1786,16 @@ class ImageViewer(QWidget):
             warning(f"Slot {expected_holder} trying to release lock held by {self.landscape_lock}")
             return False
             
-        debug(f"Releasing landscape lock from slot {self.landscape_lock}")
+        debug("Releasing landscape lock from slot %s", self.landscape_lock)
         
         # 取消强制释放定时器
-        if self.force_release_timer is not None:
+        if self.force_release_timer.isActive():
             self.force_release_timer.stop()
-            self.force_release_timer = None
-            debug(f"Cancelled force-release timer")
+            debug("Cancelled force-release timer")
+        self._force_release_holder = None
             
         self.landscape_lock = None
-        self.landscape_lock_time = None
+        self.landscape_lock_clock.invalidate()
         self.landscape_lock_stage = None
         
         # 处理等待队列
@@ -1293,7 +1805,7 @@ class ImageViewer(QWidget):
     def force_release_lock(self, original_holder: int):
         """强制释放超时的锁并清除landscape显示"""
         if self.landscape_lock == original_holder:
-            debug(f"Force releasing timed-out lock from slot {original_holder}")
+            debug("Force releasing timed-out lock from slot %s", original_holder)
             
             # 立即清除该槽位的landscape显示
             if original_holder < len(self.image_slots):
@@ -1303,24 +1815,23 @@ class ImageViewer(QWidget):
                 if original_holder < len(self.timers) and not self.image_slots[original_holder].is_pinned:
                     interval = self.get_random_portrait_interval()
                     self.timers[original_holder].start(interval)
-                    debug(f"Restarted timer for force-released slot {original_holder} with {interval}ms")
+                    debug("Restarted timer for force-released slot %s with %sms", original_holder, interval)
             
             # 清理定时器
-            if self.force_release_timer is not None:
-                self.force_release_timer = None
+            self.force_release_timer.stop()
+            self._force_release_holder = None
             
             # 释放锁和相关状态
             self.landscape_lock = None
-            self.landscape_lock_time = None
+            self.landscape_lock_clock.invalidate()
             self.landscape_lock_stage = None
             self.landscape_preview_pending = False
             
     def check_lock_timeout(self):
         """检查锁是否超时"""
         if (self.landscape_lock is not None and 
-            self.landscape_lock_time is not None):
-            elapsed = (time.time() - self.landscape_lock_time) * 1000
-            if elapsed > self.landscape_lock_timeout:
+            self.landscape_lock_clock.isValid()):
+            if self.landscape_lock_clock.elapsed() > self.landscape_lock_timeout:
                 self.force_release_lock(self.landscape_lock)
                 
     def process_landscape_queue(self):
@@ -1344,7 +1855,7 @@ class ImageViewer(QWidget):
             
     def force_slot_to_portrait(self, slot_index: int):
         """强制槽位切换到portrait图片"""
-        debug(f"Forcing slot {slot_index} to switch to portrait")
+        debug("Forcing slot %s to switch to portrait", slot_index)
         
         # 取消该槽位的待执行landscape任务
         self._cancel_pending_task(slot_index)
@@ -1353,18 +1864,13 @@ class ImageViewer(QWidget):
         portrait_img = self.get_random_portrait_image(self.current_images)
         if portrait_img:
             self.current_images[slot_index] = portrait_img
-            pixmap = self.load_image_for_display(portrait_img)
-            if pixmap:
-                self.image_slots[slot_index].show_image(portrait_img, pixmap, initial=False)
-                # 更新收藏状态
-                if portrait_img in self.favorites_list:
-                    self.image_slots[slot_index].set_favorited(True)
-                else:
-                    self.image_slots[slot_index].set_favorited(False)
-                
-                # 不在这里重启定时器 - 将在landscape流程完全结束后重启
-                self.timers[slot_index].stop() 
-                debug(f"Slot {slot_index} successfully switched to portrait: {os.path.basename(portrait_img)}, timer will restart after landscape flow completes")
+            # 后台加载，完成后显示（收藏状态在显示时更新）
+            self.request_slot_image(slot_index, portrait_img)
+            
+            # 不在这里重启定时器 - 将在landscape流程完全结束后重启
+            self.timers[slot_index].stop() 
+            debug("Slot %s switching to portrait: %s, timer will restart after landscape flow completes",
+                  slot_index, os.path.basename(portrait_img))
             
     def can_slot_use_global_queue(self, slot_index: int) -> bool:
         """检查槽位是否可以使用全局landscape队列系统"""
@@ -1381,12 +1887,12 @@ class ImageViewer(QWidget):
         
     def debug_timer_status(self):
         """Debug timer status"""
-        if hasattr(self, 'landscape_timer'):
-            # print(f"[DEBUG TIMER] Landscape timer active: {self.landscape_timer.isActive()}")
-            # print(f"[DEBUG TIMER] Landscape timer interval: {self.landscape_timer.interval()}")
-            # print(f"[DEBUG TIMER] Current layout mode: {self.current_layout_mode}")
-            # print(f"[DEBUG TIMER] Is paused: {self.is_paused}")
-            pass
+        # Cheap enough to call from a timer: nothing is queried unless debug output is on
+        if not is_debug_enabled() or not hasattr(self, 'landscape_timer'):
+            return
+        debug("Landscape timer active=%s interval=%dms mode=%s paused=%s",
+              self.landscape_timer.isActive(), self.landscape_timer.interval(),
+              self.current_layout_mode, self.is_paused)
         
         
     def switch_to_landscape_mode_with_image(self, image_path: str, source_slot_index: int = -1):
@@ -1398,19 +1904,16 @@ class ImageViewer(QWidget):
         self.landscape_source_slot_index = source_slot_index
         self.landscape_preview_pending = False  # Clear preview flag
         
-        # Save portrait timer states before stopping them
-        self.portrait_timer_states = []
+        # Save portrait timer states before stopping them (overwritten in place)
         for i, timer in enumerate(self.timers):
             remaining_time = timer.remainingTime() if timer.isActive() else 0
-            self.portrait_timer_states.append({
-                'index': i,
-                'remaining': max(remaining_time, 1000),  # Minimum 1 second
-                'was_active': timer.isActive(),
-                'current_image': self.current_images[i] if i < len(self.current_images) else ""
-            })
+            self.saved_timer_remaining[i] = max(remaining_time, 1000)  # Minimum 1 second
+            self.saved_timer_active[i] = timer.isActive()
             timer.stop()
+        self.timer_states_saved = True
             
-        debug(f"Saved portrait timer states: {[(s['index'], s['remaining'], s['was_active']) for s in self.portrait_timer_states]}")
+        debug("Saved portrait timer states: remaining %s, active %s",
+              self.saved_timer_remaining, self.saved_timer_active)
         
         # Start progressive transition animation before switching layout
         if source_slot_index >= 0 and source_slot_index < len(self.image_slots):
@@ -1421,10 +1924,8 @@ class ImageViewer(QWidget):
             
     def start_landscape_transition_animation(self, image_path: str, source_slot_index: int):
         """Start progressive transition from portrait slot to landscape mode"""
-        # First, show the landscape image in the source slot
-        pixmap = self.load_image_for_display(image_path)
-        if pixmap:
-            self.image_slots[source_slot_index].show_image(image_path, pixmap, initial=False, fast_transition=True)
+        # The source slot already shows the image from its preview, and the layout
+        # switches right away, so there is nothing to load for the slot here
         
         # Directly complete the transition without fading other slots
         # This keeps all slots visible during the 2-second preview
@@ -1441,29 +1942,10 @@ class ImageViewer(QWidget):
         
         # Reset landscape tracking
         self.landscape_image_count = 0
-        self.landscape_start_time = time.time()
-        self.last_landscape_change_time = self.landscape_start_time
         
-        # Display the specified landscape image
-        pixmap = self.load_landscape_image(image_path)
-        if pixmap:
-            self.landscape_slot.show_image(image_path, pixmap, initial=True)
-            self.landscape_image_count = 1
-            # Set favorite state if applicable
-            if image_path in self.favorites_list:
-                self.landscape_slot.set_favorited(True)
-            else:
-                self.landscape_slot.set_favorited(False)
-                
-        # Start a single-shot timer to switch back to portrait after showing this landscape image
-        try:
-            self.landscape_timer.timeout.disconnect()
-        except:
-            pass  # No connections to disconnect
-        self.landscape_timer.timeout.connect(self.change_landscape_image)
-        self.landscape_timer.setSingleShot(True)  # Single shot - only fire once
-        interval = self.get_random_landscape_interval()
-        self.landscape_timer.start(interval)
+        # Display the specified landscape image (decoded in the background); the
+        # landscape timer starts once it is shown
+        self.request_landscape_image(image_path)
         
         # Start cooldown
         self.mode_switch_cooldown.start(self.cooldown_duration)
@@ -1496,34 +1978,15 @@ class ImageViewer(QWidget):
         
         # Reset landscape tracking
         self.landscape_image_count = 0
-        self.landscape_start_time = time.time()
-        self.last_landscape_change_time = self.landscape_start_time
         
-        # Load and display a landscape image
+        # Load and display a landscape image; the landscape timer starts once it is shown
         if self.landscape_images:
-            image_path = random.choice(self.landscape_images)
-            debug(f"Initial landscape image: {os.path.basename(image_path)}")
-            pixmap = self.load_landscape_image(image_path)
-            if pixmap:
-                self.landscape_slot.show_image(image_path, pixmap, initial=True)
-                self.landscape_image_count = 1
-                # Set favorite state if applicable
-                if image_path in self.favorites_list:
-                    self.landscape_slot.set_favorited(True)
-                else:
-                    self.landscape_slot.set_favorited(False)
-                
-        # Start a single-shot timer to switch back to portrait after showing this landscape image
-        try:
-            self.landscape_timer.timeout.disconnect()
-        except:
-            pass  # No connections to disconnect
-        self.landscape_timer.timeout.connect(self.change_landscape_image)
-        self.landscape_timer.setSingleShot(True)  # Single shot - only fire once
-        interval = self.get_random_landscape_interval()
-        debug(f"Starting landscape timer with interval: {interval}ms (will switch to portrait after)")
-        self.landscape_timer.start(interval)
-        debug(f"Timer started successfully: {self.landscape_timer.isActive()}, single shot: {self.landscape_timer.isSingleShot()}")
+            image_path = self._rng.choice(self.landscape_images)
+            debug("Initial landscape image: %s", os.path.basename(image_path))
+            self.request_landscape_image(image_path)
+        else:
+            self.landscape_clock.start()
+            self.landscape_timer.start(self.get_random_landscape_interval())
         
         # Start cooldown
         self.mode_switch_cooldown.start(self.cooldown_duration)
@@ -1543,52 +2006,51 @@ class ImageViewer(QWidget):
         # Start progressive transition animation from landscape to portrait
         self.start_portrait_transition_animation()
         
+    def fades_unseen(self) -> bool:
+        """Whether transition animations would go unseen (paused, hidden or minimized)"""
+        return (self.is_paused or not self.isVisible()
+                or bool(self.window().windowState() & Qt.WindowState.WindowMinimized))
+        
     def start_portrait_transition_animation(self):
         """Start progressive transition from landscape to portrait mode"""
         # First prepare portrait slots (make them ready but invisible)
         for slot in self.image_slots:
-            slot.setGraphicsEffect(None)
             slot.setVisible(True)
+            
+        if self.fades_unseen():
+            # Nobody would see the fades - switch layouts right away
+            self.complete_portrait_transition()
+            return
         
-        # Create fade out effect for landscape widget
-        self.landscape_fade_effect = QGraphicsOpacityEffect()
-        self.landscape_fade_effect.setOpacity(1.0)
-        self.landscape_widget.setGraphicsEffect(self.landscape_fade_effect)
-        
-        # Create fade out animation for landscape
-        self.landscape_fade_animation = QPropertyAnimation(self.landscape_fade_effect, b"opacity")
-        self.landscape_fade_animation.setDuration(300)  # Faster fade
-        self.landscape_fade_animation.setStartValue(1.0)
-        self.landscape_fade_animation.setEndValue(0.3)  # Keep 30% visible during transition
+        # Fade out a snapshot of the landscape widget rather than the live widget
+        self.landscape_fade_overlay.cover(self.landscape_widget)
+        if self.is_paused and self.pause_label:
+            self.pause_label.raise_()
         
         # Start portrait fade-in immediately (overlapping with landscape fade-out)
         QTimer.singleShot(100, self.start_portrait_fade_in)  # Start after 100ms
         
-        # Connect animation completion to layout switch
-        self.landscape_fade_animation.finished.connect(self.complete_portrait_transition)
+        # Animation completion switches the layout
         self.landscape_fade_animation.start()
         
     def start_portrait_fade_in(self):
         """Start fading in portrait slots while landscape is still partially visible"""
-        # Create fade-in animation for portrait slots
-        self.portrait_fade_effects = []
-        self.portrait_fade_animations = QParallelAnimationGroup()
-        
-        for i, slot in enumerate(self.image_slots):
-            # Create opacity effect
-            fade_effect = QGraphicsOpacityEffect()
-            fade_effect.setOpacity(0.0)  # Start invisible
-            slot.setGraphicsEffect(fade_effect)
-            self.portrait_fade_effects.append(fade_effect)
-            
-            # Create fade-in animation
-            fade_anim = QPropertyAnimation(fade_effect, b"opacity")
-            fade_anim.setDuration(400)  # Slightly longer for smooth blend
-            fade_anim.setStartValue(0.0)
-            fade_anim.setEndValue(1.0)
-            self.portrait_fade_animations.addAnimation(fade_anim)
-        
-        self.portrait_fade_animations.start()
+        if self.fades_unseen():
+            # Hidden since the transition started; complete_portrait_transition finalizes directly
+            return
+            
+        # Start invisible: the curtain goes under the landscape snapshot, which
+        # still hides both until the layout switches
+        self.portrait_fade_overlay.cover(self.portrait_widget, snapshot=False)
+        self.portrait_fade_overlay.stackUnder(self.landscape_fade_overlay)
+        self.portrait_fade_animation.start()
+        
+    def _on_portrait_fade_finished(self):
+        """Remove the curtain and finalize a transition waiting on the fade"""
+        self.portrait_fade_overlay.release()
+        if self._finalize_after_fade:
+            self._finalize_after_fade = False
+            self.finalize_portrait_transition()
     
     def complete_portrait_transition(self):
         """Complete the transition to portrait mode"""
@@ -1599,119 +2061,87 @@ class ImageViewer(QWidget):
         # Calculate portrait dimensions
         self.calculate_slot_dimensions()
         
-        # Remove fade effect from landscape widget
-        self.landscape_widget.setGraphicsEffect(None)
-        
-        # Connect completion to final setup if animations exist
-        if hasattr(self, 'portrait_fade_animations') and self.portrait_fade_animations:
-            self.portrait_fade_animations.finished.connect(self.finalize_portrait_transition)
+        # Remove the landscape snapshot; setCurrentWidget raised the portrait widget,
+        # so put the fade-in curtain back on top of it
+        self.landscape_fade_overlay.release()
+        if self.portrait_fade_overlay.isVisible():
+            self.portrait_fade_overlay.raise_()
+            if self.is_paused and self.pause_label:
+                self.pause_label.raise_()
+        
+        # Finalize once the slot fade-in is done, if it is still running
+        if self.portrait_fade_animation.state() == QAbstractAnimation.State.Running:
+            self._finalize_after_fade = True
         else:
             # Fallback if animations weren't started
             self.finalize_portrait_transition()
         
     def finalize_portrait_transition(self):
         """Finalize portrait mode transition and restore timer states"""
-        # Clear fade effects
-        for slot in self.image_slots:
-            slot.setGraphicsEffect(None)
+        # Coalesce the slot updates below into a single repaint
+        self.portrait_widget.setUpdatesEnabled(False)
         
         # Ensure pause label stays on top if visible
         if self.is_paused and self.pause_label:
             self.pause_label.raise_()
         
-        # Restore portrait timer states if available, otherwise use new random intervals
-        if self.portrait_timer_states and len(self.portrait_timer_states) == len(self.timers):
-            debug(f"Restoring portrait timer states: {[(s['index'], s['remaining'], s['was_active']) for s in self.portrait_timer_states]}")
-            for state in self.portrait_timer_states:
-                i = state['index']
-                if i < len(self.timers) and state['was_active']:
-                    # Use the saved remaining time, but ensure it's reasonable
-                    remaining = max(state['remaining'], 1000)  # At least 1 second
-                    self.timers[i].start(remaining)
-                    debug(f"Restored timer {i} with {remaining}ms remaining")
-                elif i < len(self.timers):
-                    # Timer wasn't active, start with new random interval
-                    interval = self.get_random_portrait_interval()
-                    self.timers[i].start(interval)
-                    debug(f"Started new timer {i} with {interval}ms")
-            # Clear saved states
-            self.portrait_timer_states = []
-        else:
-            # No saved states or mismatch, use new random intervals
-            debug("No saved timer states, using new random intervals")
-            for i in range(len(self.timers)):
-                interval = self.get_random_portrait_interval()
-                self.timers[i].start(interval)
-        
         # Clear transition flag first so new landscape images can be detected
         self.transition_in_progress = False
         
-        # Update landscape播放槽位 - 强制更换图片避免重复显示
+        # 一次遍历重启所有portrait定时器：landscape播放槽位强制更换图片，
+        # 其余槽位恢复保存的剩余时间，没有保存状态则使用新的随机间隔
         locked_slot = self.landscape_lock
-        if (self.landscape_source_slot_index >= 0 and 
-            self.landscape_source_slot_index < len(self.image_slots)):
-            
-            if self.landscape_source_slot_index == locked_slot:
-                # 正常情况：同一槽位触发并播放了landscape
-                if not self.image_slots[locked_slot].is_pinned:
-                    debug(f"Updating landscape source slot {locked_slot} (same as locked slot)")
-                    # 强制更换图片，避免继续显示同一张landscape
-                    self.change_single_image(locked_slot)
-                    # 然后重新启动定时器
-                    interval = self.get_random_portrait_interval()
-                    self.timers[locked_slot].start(interval)
-                    debug(f"Restarted timer for updated slot {locked_slot} with {interval}ms")
-                else:
-                    # 如果是固定的，只启动定时器
-                    interval = self.get_random_portrait_interval()
-                    self.timers[locked_slot].start(interval)
-                    debug(f"Restarted timer for pinned slot {locked_slot} with {interval}ms")
-            else:
-                # 异常情况：不同槽位（可能是抢占场景）
-                debug(f"Updating different landscape source slot {self.landscape_source_slot_index} (locked slot: {locked_slot})")
-                # 处理触发landscape的槽位
-                self.timers[self.landscape_source_slot_index].stop()
-                self.change_single_image(self.landscape_source_slot_index)
-                
-                # 处理持有锁的槽位
-                if (locked_slot is not None and locked_slot < len(self.timers) and 
-                    not self.image_slots[locked_slot].is_pinned):
-                    interval = self.get_random_portrait_interval()
-                    self.timers[locked_slot].start(interval)
-                    debug(f"Restarted timer for locked slot {locked_slot} with {interval}ms")
-        elif locked_slot is not None and locked_slot < len(self.timers):
-            # 备用逻辑：如果没有记录source_slot_index，至少重启locked_slot的定时器
-            if not self.image_slots[locked_slot].is_pinned:
+        source_slot = self.landscape_source_slot_index
+        if not 0 <= source_slot < len(self.image_slots):
+            source_slot = -1
+        if self.timer_states_saved:
+            debug("Restoring portrait timer states: remaining %s, active %s",
+                  self.saved_timer_remaining, self.saved_timer_active)
+        else:
+            debug("No saved timer states, using new random intervals")
+            
+        for i, timer in enumerate(self.timers):
+            pinned = self.image_slots[i].is_pinned
+            if i == source_slot and (i != locked_slot or not pinned):
+                # 强制更换图片，避免继续显示同一张landscape（推迟到动画回调之后）
+                debug("Updating landscape source slot %s (locked slot: %s)", i, locked_slot)
+                QTimer.singleShot(0, partial(self._reset_slot, i))
+                continue
+            elif i == source_slot or (i == locked_slot and not pinned):
+                # 固定的source槽位保留图片只重启定时器；锁槽位使用新的间隔
                 interval = self.get_random_portrait_interval()
-                self.timers[locked_slot].start(interval)
-                debug(f"Restarted timer for landscape slot {locked_slot} with {interval}ms")
-                
-        # 确保所有被强制切换到portrait的槽位的定时器都重新启动
-        # 这是为了处理在landscape流程中被force_slot_to_portrait停止的定时器
-        for i in range(len(self.timers)):
-            if not self.timers[i].isActive() and not self.image_slots[i].is_pinned:
-                debug(f"Found inactive timer for slot {i}, restarting")
+            elif self.timer_states_saved and self.saved_timer_active[i]:
+                # Use the saved remaining time, but ensure it's reasonable
+                interval = max(self.saved_timer_remaining[i], 1000)  # At least 1 second
+            else:
                 interval = self.get_random_portrait_interval()
-                self.timers[i].start(interval)
-                debug(f"Restarted inactive timer {i} with {interval}ms")
+            timer.start(interval)
+            debug("Started timer %s with %sms", i, interval)
+        # Clear saved states
+        self.timer_states_saved = False
             
         # Start cooldown
         self.mode_switch_cooldown.start(self.cooldown_duration)
         
         # 释放landscape锁（最后执行，确保所有清理完成）
         if self.landscape_lock is not None:
-            debug(f"Releasing landscape lock from slot {self.landscape_lock} after complete transition")
+            debug("Releasing landscape lock from slot %s after complete transition", self.landscape_lock)
             self.release_landscape_lock(self.landscape_lock)
+            
+        self.portrait_widget.setUpdatesEnabled(True)
+        self.portrait_widget.update()
         
     @pyqtSlot(int, str, bool)
     def on_favorite_toggled(self, slot_index: int, image_path: str, is_favorited: bool):
         """Handle favorite toggle from image slot"""
         if is_favorited:
-            if image_path not in self.favorites_list:
+            if image_path not in self._favorites_set:
                 self.favorites_list.append(image_path)
+                self._favorites_set.add(image_path)
         else:
-            if image_path in self.favorites_list:
+            if image_path in self._favorites_set:
                 self.favorites_list.remove(image_path)
+                self._favorites_set.discard(image_path)
         
         # Auto-enable dedicated slot when favorites > 1 and not manually disabled
         if len(self.favorites_list) > 1 and not self.dedicated_slot_auto_disabled:
@@ -1722,7 +2152,7 @@ class ImageViewer(QWidget):
             self.disable_dedicated_slot(auto=True)
         
         # Emit signal for menu update
-        self.favorites_changed.emit(self.favorites_list.copy())
+        self.favorites_changed.emit(tuple(self.favorites_list))
     
     def enable_dedicated_slot(self, auto=False):
         """Enable the dedicated favorites slot"""
@@ -1735,19 +2165,11 @@ class ImageViewer(QWidget):
         
         # Apply special styling to slot 0
         if self.image_slots:
-            self.image_slots[0].setStyleSheet("""
-                QFrame {
-                    border: 3px solid #ffd700;
-                    border-radius: 12px;
-                    background-color: rgba(255, 215, 0, 10);
-                }
-            """)
             self.image_slots[0].set_dedicated(True)
             
             # Force update of slot 0 to show a favorite
             if self.favorites_list:
-                self.timers[0].stop()
-                self.change_single_image(0)
+                self._reset_slot(0)
     
     def disable_dedicated_slot(self, auto=False):
         """Disable the dedicated favorites slot"""
@@ -1757,7 +2179,6 @@ class ImageViewer(QWidget):
         
         # Remove special styling from slot 0
         if self.image_slots:
-            self.image_slots[0].setStyleSheet("")
             self.image_slots[0].set_dedicated(False)
             
     def get_favorites(self):
@@ -1766,10 +2187,12 @@ class ImageViewer(QWidget):
     
     def set_favorites(self, favorites: List[str]):
         """Set the favorites list (for loading from settings)"""
-        self.favorites_list = favorites.copy()
+        # Drop duplicates (keeping order) so the list and the set stay in step
+        self.favorites_list = list(dict.fromkeys(favorites))
+        self._favorites_set = set(self.favorites_list)
         # Update all slots to reflect favorite state
         for slot in self.image_slots:
-            if slot.current_image_path in self.favorites_list:
+            if slot.current_image_path in self._favorites_set:
                 slot.set_favorited(True)
         
         # Check if we should auto-enable or auto-disable dedicated slot
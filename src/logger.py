@@ -48,6 +48,7 @@ class Logger:
     
     _instance: Optional['Logger'] = None
     _logger: Optional[logging.Logger] = None
+    _debug_enabled = False  # Mirrors the level, checked before every debug call
     
     def __new__(cls):
         if cls._instance is None:
@@ -61,7 +62,8 @@ class Logger:
     def _setup_logger(self):
         """Setup the logger with appropriate handlers and formatters"""
         self._logger = logging.getLogger('Reel77')
-        self._logger.setLevel(logging.DEBUG)  # Always capture all levels
+        # Same level as the console handler below, so disabled calls stop early
+        self._logger.setLevel(logging.INFO)
         
         # Clear any existing handlers
         self._logger.handlers.clear()
@@ -90,11 +92,19 @@ class Logger:
         if self._console_handler:
             log_level = getattr(logging, level.upper(), logging.INFO)
             self._console_handler.setLevel(log_level)
+            # The console is the only handler, so filter at the logger too: calls
+            # below the level then return before a LogRecord is even built
+            self._logger.setLevel(log_level)
+            self._debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
             self.info(f"Log level set to {level.upper()}")
     
+    def is_debug_enabled(self) -> bool:
+        """Whether debug messages are currently emitted"""
+        return self._debug_enabled
+    
     def debug(self, message: str, *args, **kwargs):
         """Log debug message"""
-        if self._logger:
+        if self._debug_enabled:
             self._logger.debug(message, *args, **kwargs)
     
     def info(self, message: str, *args, **kwargs):
@@ -122,6 +132,16 @@ class Logger:
 logger = Logger()
 
 
+# Bound once: the convenience functions below sit on hot GUI paths, so they skip
+# the Logger wrapper methods and the attribute lookups to reach logging
+_log = logger._logger
+_log_debug = _log.debug
+_log_info = _log.info
+_log_warning = _log.warning
+_log_error = _log.error
+_log_critical = _log.critical
+
+
 def get_logger() -> Logger:
     """Get the global logger instance"""
     return logger
@@ -132,26 +152,32 @@ def set_log_level(level: str):
     logger.set_level(level)
 
 
+def is_debug_enabled() -> bool:
+    """Whether debug messages are currently emitted, to skip building costly arguments"""
+    return logger._debug_enabled
+
+
 def debug(message: str, *args, **kwargs):
     """Convenience function for debug logging"""
-    logger.debug(message, *args, **kwargs)
+    if logger._debug_enabled:
+        _log_debug(message, *args, **kwargs)
 
 
 def info(message: str, *args, **kwargs):
     """Convenience function for info logging"""
-    logger.info(message, *args, **kwargs)
+    _log_info(message, *args, **kwargs)
 
 
 def warning(message: str, *args, **kwargs):
     """Convenience function for warning logging"""
-    logger.warning(message, *args, **kwargs)
+    _log_warning(message, *args, **kwargs)
 
 
 def error(message: str, *args, **kwargs):
     """Convenience function for error logging"""
-    logger.error(message, *args, **kwargs)
+    _log_error(message, *args, **kwargs)
 
 
 def critical(message: str, *args, **kwargs):
     """Convenience function for critical logging"""
-    logger.critical(message, *args, **kwargs)
\ No newline at end of file
+    _log_critical(message, *args, **kwargs)
\ No newline at end of file
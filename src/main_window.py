@@ -312,7 +312,7 @@ class MainWindow(QMainWindow):
         # Recreate menu bar with new language
         self.create_menu_bar()
         
-    @pyqtSlot(list)
+    @pyqtSlot(tuple)
     def update_favorites_menu(self, favorites=None):
         """Update the favorites menu with current favorites"""
         if not self.favorites_menu:
@@ -407,7 +407,7 @@ class MainWindow(QMainWindow):
             if file_path in favorites:
                 favorites.remove(file_path)
                 self.image_viewer.set_favorites(favorites)
-                self.image_viewer.favorites_changed.emit(favorites)
+                self.image_viewer.favorites_changed.emit(tuple(favorites))
     
     def enable_dedicated_slot(self):
         """Enable the dedicated favorites slot"""
@@ -437,13 +437,6 @@ class MainWindow(QMainWindow):
             
             # Apply dedicated slot styling only if enabled AND there are enough favorites
             if dedicated_enabled and len(favorites) > 1 and self.image_viewer.image_slots:
-                self.image_viewer.image_slots[0].setStyleSheet("""
-                    QFrame {
-                        border: 3px solid #ffd700;
-                        border-radius: 12px;
-                        background-color: rgba(255, 215, 0, 10);
-                    }
-                """)
                 self.image_viewer.image_slots[0].set_dedicated(True)
             elif dedicated_enabled and len(favorites) <= 1:
                 # Dedicated slot was enabled but not enough favorites, disable it
@@ -470,7 +463,7 @@ class MainWindow(QMainWindow):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Clear favorites list
             self.image_viewer.set_favorites([])
-            self.image_viewer.favorites_changed.emit([])
+            self.image_viewer.favorites_changed.emit(())
             # Update all displayed images' favorite state
             for slot in self.image_viewer.image_slots:
                 slot.set_favorited(False)
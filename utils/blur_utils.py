@@ -0,0 +1,76 @@
+import numpy as np
+from PyQt6.QtGui import QImage
+
+
+# 5-tap binomial approximation of a Gaussian, as used by OpenCV's pyrDown.
+# The weights sum to 16, so one separable pass stays within uint16.
+_PYR_WEIGHTS = (1, 4, 6, 4, 1)
+
+
+def qimage_to_array(image: QImage) -> np.ndarray:
+    """Return a read-only (h, w, 4) uint8 view of an RGB32 QImage"""
+    width, height = image.width(), image.height()
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    # Rows may be padded, so slice each scanline down to its visible pixels
+    rows = np.frombuffer(ptr, dtype=np.uint8).reshape(height, image.bytesPerLine())
+    return rows[:, :width * 4].reshape(height, width, 4)
+
+
+def array_to_qimage(array: np.ndarray) -> QImage:
+    """Wrap an (h, w, 4) uint8 array back into an RGB32 QImage"""
+    height, width = array.shape[:2]
+    data = np.ascontiguousarray(array).tobytes()
+    image = QImage(data, width, height, 4 * width, QImage.Format.Format_RGB32)
+    # Make a copy to ensure data persistence
+    return image.copy()
+
+
+def pyr_down(array: np.ndarray) -> np.ndarray:
+    """One Gaussian pyramid level: separable 5-tap blur fused with 2x decimation.
+
+    The kernel is only evaluated at the pixels the decimation keeps, and both
+    passes accumulate in uint16 before a single rounding shift back to uint8.
+    """
+    height, width = array.shape[:2]
+
+    # Horizontal pass, evaluated on even columns only
+    padded = np.pad(array, ((0, 0), (2, 2), (0, 0)), mode='edge').astype(np.uint16)
+    horizontal = padded[:, 0:width:2].copy()
+    for k in range(1, 5):
+        horizontal += padded[:, k:k + width:2] * _PYR_WEIGHTS[k]
+
+    # Vertical pass, evaluated on even rows only
+    padded = np.pad(horizontal, ((2, 2), (0, 0), (0, 0)), mode='edge')
+    vertical = padded[0:height:2].copy()
+    for k in range(1, 5):
+        vertical += padded[k:k + height:2] * _PYR_WEIGHTS[k]
+
+    return ((vertical + 128) >> 8).astype(np.uint8)
+
+
+def gaussian_pyramid_blur(image: QImage, levels: int = 3, darken: int = 0) -> QImage:
+    """Blur an image by walking down a Gaussian pyramid.
+
+    Returns the reduced image (1 / 2**levels of the input size); callers scale
+    it back up to the size they need. ``darken`` is the alpha (0-255) of a black
+    overlay blended into the result.
+    """
+    if image.isNull():
+        return QImage()  # constBits() of a null image is None
+    image = image.convertToFormat(QImage.Format.Format_RGB32)
+    array = qimage_to_array(image)
+
+    for _ in range(levels):
+        # Stop before the buffer collapses below a couple of pixels
+        if array.shape[0] < 4 or array.shape[1] < 4:
+            break
+        array = pyr_down(array)
+
+    # Blend the overlay into the small buffer (also detaches from the QImage)
+    scale = 255 - darken
+    array = ((array.astype(np.uint16) * scale + 127) // 255).astype(np.uint8)
+    # RGB32 expects an opaque alpha byte
+    array[..., 3] = 255
+
+    return array_to_qimage(array)
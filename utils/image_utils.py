@@ -1,14 +1,29 @@
 import os
 import random
+import logging
 from typing import List, Tuple, Optional
 from PIL import Image, ImageOps
-from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QImageReader, QImageIOHandler
+from PyQt6.QtCore import Qt, QSize
 from pillow_heif import register_heif_opener
 
+_logger = logging.getLogger('Reel77')
+
 # Register HEIF/HEIC support with Pillow
 register_heif_opener()
 
+# Formats Qt decodes natively; these can be decoded straight at the target size
+_QT_NATIVE_FORMATS = {'.jpg', '.jpeg', '.png', '.bmp', '.gif'}
+
+# Images within this many pixels of the target size are used as decoded, unscaled
+SCALE_TOLERANCE_PX = 2
+
+
+def close_to_size(width: int, height: int, target_width: int, target_height: int) -> bool:
+    """Whether a size is within SCALE_TOLERANCE_PX of a target in both dimensions"""
+    return (abs(width - target_width) <= SCALE_TOLERANCE_PX
+            and abs(height - target_height) <= SCALE_TOLERANCE_PX)
+
 
 def get_image_files(directory: str) -> List[str]:
     """Get all image files from a directory"""
@@ -22,7 +37,7 @@ def get_image_files(directory: str) -> List[str]:
                 if any(file.lower().endswith(fmt) for fmt in supported_formats):
                     image_files.append(os.path.join(directory, file))
         except Exception as e:
-            print(f"Error reading directory {directory}: {e}")
+            _logger.error("Error reading directory %s: %s", directory, e)
             
     return image_files
 
@@ -43,13 +58,56 @@ def get_image_files_from_dirs(directories: List[str]) -> List[str]:
     return all_files
 
 
-def load_and_scale_image(image_path: str, target_size: Tuple[int, int], 
-                        maintain_aspect: bool = True) -> Optional[QPixmap]:
-    """Load an image and scale it to target size"""
+def read_scaled_qimage(image_path: str, target_size: Tuple[int, int],
+                       maintain_aspect: bool = True) -> Optional[QImage]:
+    """Decode an image with QImageReader directly at the target size, or None if Qt can't"""
+    reader = QImageReader(image_path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if not size.isValid() or target_size[0] <= 0 or target_size[1] <= 0:
+        return None
+    
+    # The scaled size applies before the EXIF transform, which may swap width and height
+    target = QSize(target_size[0], target_size[1])
+    if reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90:
+        target.transpose()
+    if maintain_aspect:
+        target = size.scaled(target, Qt.AspectRatioMode.KeepAspectRatio)
+    
+    # Already (nearly) the target size: a resample would cost a pass for no visible change
+    if close_to_size(size.width(), size.height(), target.width(), target.height()):
+        qimage = reader.read()
+        return None if qimage.isNull() else qimage
+    
+    # JPEG decodes at a reduced DCT scale; other formats are smooth-scaled by the reader
+    reader.setScaledSize(target)
+    qimage = reader.read()
+    return None if qimage.isNull() else qimage
+
+
+def load_scaled_image(image_path: str, target_size: Tuple[int, int],
+                      maintain_aspect: bool = True) -> Optional[QImage]:
+    """Load an image and scale it to target size (QImage only, safe off the GUI thread)"""
+    # Qt-native formats: decode at the target size in one pass
+    if os.path.splitext(image_path)[1].lower() in _QT_NATIVE_FORMATS:
+        qimage = read_scaled_qimage(image_path, target_size, maintain_aspect)
+        if qimage is not None:
+            return qimage
+    
+    # Everything else (HEIF, WebP, TIFF, ...) or files Qt failed on goes through PIL
     try:
         # Load image with PIL first for better format support
         pil_image = Image.open(image_path)
         
+        # Let the decoder downscale while decoding (JPEG DCT scaling). The
+        # draft stays at least as large as the requested size.
+        if target_size[0] > 0 and target_size[1] > 0:
+            draft_size = target_size
+            # EXIF rotation by 90/270 degrees swaps width and height below
+            if pil_image.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+                draft_size = (target_size[1], target_size[0])
+            pil_image.draft(pil_image.mode, draft_size)
+        
         # Handle EXIF orientation for JPEG images
         try:
             pil_image = ImageOps.exif_transpose(pil_image)
@@ -94,27 +152,31 @@ def load_and_scale_image(image_path: str, target_size: Tuple[int, int],
         # Make a copy to ensure data persistence
         qimage = qimage.copy()
         
-        # Convert to pixmap
-        pixmap = QPixmap.fromImage(qimage)
-        
-        # Scale to target size
+        # Scale to target size, unless it (nearly) is already
+        if maintain_aspect:
+            fitted = QSize(qimage.width(), qimage.height()).scaled(
+                target_size[0], target_size[1], Qt.AspectRatioMode.KeepAspectRatio)
+        else:
+            fitted = QSize(target_size[0], target_size[1])
+        if close_to_size(qimage.width(), qimage.height(), fitted.width(), fitted.height()):
+            return qimage
         if maintain_aspect:
-            pixmap = pixmap.scaled(
+            qimage = qimage.scaled(
                 target_size[0], target_size[1],
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation
             )
         else:
-            pixmap = pixmap.scaled(
+            qimage = qimage.scaled(
                 target_size[0], target_size[1],
                 Qt.AspectRatioMode.IgnoreAspectRatio,
                 Qt.TransformationMode.SmoothTransformation
             )
             
-        return pixmap
+        return qimage
         
     except Exception as e:
-        print(f"Error loading image {image_path}: {e}")
+        _logger.error("Error loading image %s: %s", image_path, e)
         return None
 
 
@@ -0,0 +1,84 @@
+import os
+import json
+import logging
+from typing import Dict, Optional, Set, Tuple
+from PyQt6.QtCore import QStandardPaths
+
+_logger = logging.getLogger('Reel77')
+
+_CACHE_FILE = 'orientation.json'
+
+
+def _cache_path() -> str:
+    """Location of the cache file in the per-user cache directory"""
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    return os.path.join(cache_dir, _CACHE_FILE)
+
+
+def file_signature(image_path: str) -> Optional[Tuple[float, int]]:
+    """(mtime, size) of a file, or None if it can't be stat'ed"""
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return None
+    return stat.st_mtime, stat.st_size
+
+
+def load_orientation_cache() -> Dict[str, list]:
+    """Load the cache: image path -> [mtime, size, is landscape]; empty if missing or corrupt"""
+    try:
+        with open(_cache_path(), 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def lookup_orientation(entries: Dict[str, list], image_path: str,
+                       signature: Optional[Tuple[float, int]]) -> Optional[bool]:
+    """Cached orientation for a file, or None if unknown or the file changed since"""
+    entry = entries.get(image_path)
+    if signature is None or not isinstance(entry, list) or len(entry) != 3:
+        return None
+    if (entry[0], entry[1]) != signature:
+        return None
+    return bool(entry[2])
+
+
+def save_orientation_cache(entries: Dict[str, list]):
+    """Write the cache atomically, so an interrupted write never leaves a corrupt file"""
+    path = _cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        _logger.warning("Could not save orientation cache %s: %s", path, e)
+
+
+def prune_orientation_cache(entries: Dict[str, list], known_files: Set[str]) -> int:
+    """Drop entries for files that no longer exist; returns how many were dropped"""
+    # known_files is a fresh directory scan, so its directories need no disk access;
+    # other directories are listed once each instead of stat'ing every entry
+    scanned_dirs = {os.path.dirname(f) for f in known_files}
+    listings: Dict[str, Set[str]] = {}
+    stale = []
+    for image_path in entries:
+        if image_path in known_files:
+            continue
+        directory, name = os.path.split(image_path)
+        if directory in scanned_dirs:
+            stale.append(image_path)
+            continue
+        if directory not in listings:
+            try:
+                listings[directory] = set(os.listdir(directory))
+            except OSError:
+                listings[directory] = set()
+        if name not in listings[directory]:
+            stale.append(image_path)
+    for image_path in stale:
+        del entries[image_path]
+    return len(stale)